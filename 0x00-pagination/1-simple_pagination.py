@@ -4,7 +4,7 @@ This module provides pagination for a dataset of popular baby names.
 """
 
 import csv
-from typing import List, Tuple
+from typing import Callable, List, Optional, Sequence, Tuple
 
 
 def index_range(page: int, page_size: int) -> Tuple[int, int]:
@@ -27,11 +27,22 @@ class Server:
     """Server class to paginate a database of popular baby names."""
     DATA_FILE = "Popular_Baby_Names.csv"
 
-    def __init__(self):
+    def __init__(self,
+                 loader: Optional[Callable[[str], Sequence[List]]] = None):
+        """
+        Args:
+            loader (Callable): Optional callable turning DATA_FILE into a
+                sequence of its data rows, such as MappedDataset from
+                4-mmap_dataset or ColumnarDataset from 5-columnar_dataset;
+                the file is read into a list if None.
+        """
         self.__dataset = None
+        self.__loader = loader
 
-    def dataset(self) -> List[List]:
+    def dataset(self) -> Sequence[List]:
         """Cached dataset."""
+        if self.__dataset is None and self.__loader is not None:
+            self.__dataset = self.__loader(self.DATA_FILE)
         if self.__dataset is None:
             with open(self.DATA_FILE, mode='r', encoding='utf-8') as f:
                 reader = csv.reader(f)
@@ -59,8 +70,6 @@ class Server:
         # Get the start and end indices for the pagination
         start_index, end_index = index_range(page, page_size)
 
-        # Return the appropriate slice of the dataset
-        dataset = self.dataset()
-        if start_index >= len(dataset):
-            return []
-        return dataset[start_index:end_index]
+        # Return the appropriate slice of the dataset, empty past its
+        # end; slicing avoids len(), which makes a lazy loader read all
+        return list(self.dataset()[start_index:end_index])
@@ -5,19 +5,31 @@ Deletion-resilient hypermedia pagination
 
 import csv
 import math
-from typing import List, Dict
+from typing import Callable, Dict, List, Optional, Sequence
 
 
 class Server:
     """Server class to paginate a database of popular baby names."""
     DATA_FILE = "Popular_Baby_Names.csv"
 
-    def __init__(self):
+    def __init__(self,
+                 loader: Optional[Callable[[str], Sequence[List]]] = None):
+        """
+        Args:
+            loader (Callable): Optional callable turning DATA_FILE into a
+                sequence of its data rows, such as MappedDataset from
+                4-mmap_dataset or ColumnarDataset from 5-columnar_dataset;
+                the file is read into a list if None.
+        """
         self.__dataset = None
+        self.__loader = loader
         self.__indexed_dataset = None
+        self.__live = None  # 1 for each row not deleted
 
-    def dataset(self) -> List[List]:
+    def dataset(self) -> Sequence[List]:
         """Cached dataset."""
+        if self.__dataset is None and self.__loader is not None:
+            self.__dataset = self.__loader(self.DATA_FILE)
         if self.__dataset is None:
             with open(self.DATA_FILE) as f:
                 reader = csv.reader(f)
@@ -29,30 +41,81 @@ class Server:
     def indexed_dataset(self) -> Dict[int, List]:
         """Dataset indexed by sorting position, starting at 0."""
         if self.__indexed_dataset is None:
-            dataset = self.dataset()
-            self.__indexed_dataset = {
-                i: dataset[i] for i in range(len(dataset))
-            }
+            self.__indexed_dataset = dict(enumerate(self.dataset()))
         return self.__indexed_dataset
 
+    def live_rows(self) -> bytearray:
+        """
+        One byte per row of the dataset, 1 while the row is not known
+        to be deleted, built on first use. Rows deleted from the dict
+        directly are cleared lazily, when a page reaches them.
+        """
+        if self.__live is None:
+            self.__live = bytearray(len(self.dataset()))
+            for index in self.indexed_dataset():
+                self.__live[index] = 1
+        return self.__live
+
+    def delete(self, index: int) -> None:
+        """
+        Deletes a row, keeping the live rows up to date in O(1).
+
+        Args:
+            index (int): Index of the row in indexed_dataset().
+
+        Raises:
+            KeyError: If no row has this index.
+        """
+        del self.indexed_dataset()[index]
+        self.live_rows()[index] = 0
+
+    def _next_live(self, index: int) -> int:
+        """
+        Returns the first index at or after `index` still in
+        indexed_dataset(), or -1 if there is none.
+        """
+        indexed = self.indexed_dataset()
+        live = self.live_rows()
+        i = live.find(1, index)
+        while i != -1 and i not in indexed:
+            # Deleted from the dict directly: clear the whole run with
+            # one slice assignment, so later pages skip it in C
+            j = i + 1
+            while j < len(live) and j not in indexed:
+                j += 1
+            live[i:j] = bytes(j - i)
+            i = live.find(1, j)
+        return i
+
     def get_hyper_index(self, index: int = None, page_size: int = 10) -> Dict:
-        """Returns a page of the dataset with deletion-resilience."""
+        """
+        Returns a page of the dataset with deletion-resilience.
+
+        The first row at or after `index` is found with a byte search
+        of the live rows, so rows deleted with delete() cost nothing to
+        skip, and rows deleted from the dict directly are only walked
+        over once. Indexes are positions in the original dataset, so
+        deletions never make a next_index out of range; next_index is
+        None once no row is left.
+        """
+        indexed = self.indexed_dataset()
         # Ensure the index is valid
         assert isinstance(index, int) and \
-               0 <= index < len(self.__indexed_dataset)
+            0 <= index < len(self.dataset())
 
         # Prepare the data for the page
         data = []
-        current_index = index
-        for _ in range(page_size):
-            while (current_index not in self.__indexed_dataset and
-                   current_index < len(self.__dataset)):
-                current_index += 1
-            if current_index < len(self.__indexed_dataset):
-                data.append(self.__indexed_dataset[current_index])
-                current_index += 1
-
-        next_index = current_index
+        i = self._next_live(index)
+        last = None
+        while len(data) < page_size and i != -1:
+            data.append(indexed[i])
+            last = i
+            i = self._next_live(i + 1)
+
+        # Past the last row returned, while live rows remain after it
+        next_index = None
+        if i != -1:
+            next_index = last + 1 if data else i
 
         return {
             'index': index,
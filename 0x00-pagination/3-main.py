@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Main file
+"""
+import time
+
+Server = __import__('3-hypermedia_del_pagination').Server
+
+server = Server()
+
+server.indexed_dataset()
+total = len(server.dataset())
+
+try:
+    server.get_hyper_index(total, 100)
+except AssertionError:
+    print("AssertionError raised when out of range")
+
+
+index = 3
+page_size = 2
+
+print("Nb items: {}".format(len(server.indexed_dataset())))
+
+# 1- request first index
+res = server.get_hyper_index(index, page_size)
+print(res)
+
+# 2- request next index
+print(server.get_hyper_index(res.get('next_index'), page_size))
+
+# 3- remove the first index
+del server._Server__indexed_dataset[res.get('index')]
+print("Nb items: {}".format(len(server.indexed_dataset())))
+
+# 4- request again the initial index -> the first data retreives is not
+# the same as the first request
+print(server.get_hyper_index(index, page_size))
+
+# 5- request again initial next index -> same data page as the request 2-
+print(server.get_hyper_index(res.get('next_index'), page_size))
+
+# 6- delete a large range, then page through to the end
+for i in range(10, total // 2):
+    server.delete(i)
+rows = 0
+pages = 0
+next_index = 0
+while next_index is not None:
+    res = server.get_hyper_index(next_index, 100)
+    rows += len(res.get('data'))
+    pages += 1
+    next_index = res.get('next_index')
+print("Paged {} rows in {} pages, {} left".format(
+    rows, pages, len(server.indexed_dataset())))
+print(rows == len(server.indexed_dataset()))
+
+# 7- deletions on a large dataset stay cheap: delete() is O(1), and a
+# run of rows deleted from the dict directly is skipped once
+big = Server(loader=lambda path: [[str(i)] for i in range(1000000)])
+big.indexed_dataset()
+start = time.perf_counter()
+for i in range(0, 40000, 2):
+    big.delete(i)
+deletes = time.perf_counter() - start
+for i in range(40000, 540000):
+    del big._Server__indexed_dataset[i]
+start = time.perf_counter()
+first = big.get_hyper_index(0, 20)
+again = big.get_hyper_index(39990, 20)
+pages = time.perf_counter() - start
+print(first.get('data')[0], again.get('data')[-1], again.get('next_index'))
+print("20000 deletes in under 1s: {}".format(deletes < 1))
+print("Pages past 500000 deleted rows in under 1s: {}".format(pages < 1))
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+This module provides a memory-mapped, lazily parsed CSV dataset.
+"""
+
+import csv
+import hashlib
+import io
+import mmap
+import os
+import struct
+from array import array
+from collections.abc import Sequence
+from typing import Iterator, List, Optional, Union
+
+# magic, source size, source mtime (ns), source digest, row count;
+# native byte order, as the sidecar is only read on the machine that
+# wrote it, and a multiple of 8 bytes so the offsets that follow align
+INDEX_HEADER = struct.Struct("=8sQQ16sQ")
+INDEX_MAGIC = b"ROWIDX01"
+DIGEST_SPAN = 64 * 1024
+
+
+class MappedDataset(Sequence):
+    """
+    Read-only sequence of the data rows of a CSV file, header excluded.
+
+    The file is memory-mapped, so worker processes share its pages,
+    and only an index of row offsets is kept in memory. The index is
+    built incrementally: a row is located by scanning only up to it,
+    and only the rows asked for are parsed. len() indexes the whole
+    file.
+
+    Once complete, the index is saved to a sidecar file next to the
+    CSV (path + '.idx'), and later instances map it instead of
+    scanning, so they start in constant time. The sidecar records the
+    size, modification time and a digest of the first and last 64 KiB
+    of the CSV, and is rebuilt when any of them changes.
+    """
+
+    def __init__(self, path: str, encoding: str = 'utf-8',
+                 sidecar: bool = True) -> None:
+        """
+        Map a CSV file and skip its header row.
+
+        Args:
+            path (str): Path of the CSV file.
+            encoding (str): Encoding of the file (default is utf-8).
+            sidecar (bool): Whether to reuse and write the sidecar
+                index (default is True).
+        """
+        self.path = path
+        self.encoding = encoding
+        self.index_path: Optional[str] = path + '.idx' if sidecar else None
+        self.__file = open(path, mode='rb')
+        self.__size = self.__file.seek(0, io.SEEK_END)
+        self.__map = (mmap.mmap(self.__file.fileno(), 0,
+                                access=mmap.ACCESS_READ)
+                      if self.__size else b'')
+        self.__index_map = None
+        self.offsets = array('Q')  # Start of each data row
+        self.__end = 0  # End of the last row indexed
+        self.__complete = False
+        if self.index_path is None or not self._load_index():
+            self.__end = self._skip_row(0)  # The header row
+            self.__complete = self.__end >= self.__size
+
+    def _stamp(self) -> bytes:
+        """
+        Returns the source fields of a sidecar header for this CSV.
+        """
+        stat = os.fstat(self.__file.fileno())
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(self.__map[:DIGEST_SPAN])
+        digest.update(self.__map[max(0, self.__size - DIGEST_SPAN):])
+        return struct.pack("=QQ16s", self.__size, stat.st_mtime_ns,
+                           digest.digest())
+
+    def _load_index(self) -> bool:
+        """
+        Maps the sidecar index if it matches the CSV.
+
+        Returns:
+            bool: Whether the sidecar was used.
+        """
+        try:
+            with open(self.index_path, mode='rb') as f:
+                index_map = mmap.mmap(f.fileno(), 0,
+                                      access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return False  # Missing, unreadable or empty
+        if len(index_map) >= INDEX_HEADER.size:
+            header = INDEX_HEADER.unpack_from(index_map)
+            count = header[4]
+            if (header[0] == INDEX_MAGIC and
+                    struct.pack("=QQ16s", *header[1:4]) == self._stamp() and
+                    len(index_map) == INDEX_HEADER.size + 8 * count):
+                self.__index_map = index_map
+                self.offsets = memoryview(index_map)[
+                    INDEX_HEADER.size:].cast('Q')
+                self.__end = self.__size
+                self.__complete = True
+                return True
+        index_map.close()
+        return False
+
+    def _save_index(self) -> None:
+        """
+        Writes the complete index to the sidecar, atomically, so that
+        readers never see half of it. Failures only cost the speedup.
+        """
+        tmp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, mode='wb') as f:
+                f.write(INDEX_MAGIC + self._stamp() +
+                        struct.pack("=Q", len(self.offsets)))
+                self.offsets.tofile(f)
+            os.replace(tmp_path, self.index_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def _skip_row(self, pos: int) -> int:
+        """
+        Returns the offset just past the row starting at `pos`. A quoted
+        field may span several lines.
+        """
+        data, size = self.__map, self.__size
+        quotes = 0
+        while pos < size:
+            newline = data.find(b'\n', pos)
+            end = size if newline == -1 else newline + 1
+            quotes += data[pos:end].count(b'"')
+            pos = end
+            # An odd number of quotes leaves a field open
+            if quotes % 2 == 0:
+                break
+        return pos
+
+    def _index_until(self, stop: int) -> None:
+        """
+        Extend the row-offset index to at least `stop` rows, or to the
+        end of the file.
+
+        Args:
+            stop (int): Number of rows that should be indexed.
+        """
+        if self.__complete:
+            return
+        offsets, size = self.offsets, self.__size
+        pos = self.__end
+        while len(offsets) < stop and pos < size:
+            offsets.append(pos)
+            pos = self._skip_row(pos)
+        self.__end = pos
+        self.__complete = pos >= size
+        if self.__complete and self.index_path is not None:
+            self._save_index()
+
+    def _row_end(self, i: int) -> int:
+        """
+        Returns the offset just past indexed row i.
+        """
+        if i + 1 < len(self.offsets):
+            return self.offsets[i + 1]
+        return self.__end
+
+    def _parse(self, start: int, stop: int) -> List[List]:
+        """
+        Parses the indexed rows start to stop - 1 in one pass.
+        """
+        if start >= stop:
+            return []
+        chunk = self.__map[self.offsets[start]:self._row_end(stop - 1)]
+        text = chunk.decode(self.encoding)
+        return list(csv.reader(io.StringIO(text, newline='')))
+
+    def __len__(self) -> int:
+        """
+        Returns the number of data rows, indexing the whole file.
+        """
+        if not self.__complete:
+            self._index_until(self.__size)
+        return len(self.offsets)
+
+    def __getitem__(self, index: Union[int, slice]):
+        """
+        Returns one parsed row, or a list of them for a slice.
+
+        Args:
+            index (Union[int, slice]): Row number or slice of rows.
+
+        Returns:
+            The row as a list of strings, or a list of rows.
+        """
+        if isinstance(index, slice):
+            start, stop, step = index.start, index.stop, index.step
+            if stop is None:
+                stop = len(self)
+            if step in (None, 1) and stop >= 0 and (start is None or
+                                                    start >= 0):
+                # Forward slice: index only up to its end
+                self._index_until(stop)
+                return self._parse(start or 0, min(stop, len(self.offsets)))
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if index >= 0:
+            self._index_until(index + 1)
+        if not 0 <= index < len(self.offsets):
+            raise IndexError("dataset index out of range")
+        return self._parse(index, index + 1)[0]
+
+    def __iter__(self) -> Iterator[List]:
+        """
+        Yields the rows in order, parsing them a block at a time.
+        """
+        start = 0
+        while True:
+            rows = self[start:start + 1024]
+            yield from rows
+            if len(rows) < 1024:
+                return
+            start += 1024
+
+    def close(self) -> None:
+        """
+        Unmaps and closes the file.
+        """
+        if self.__index_map is not None:
+            self.offsets.release()
+            self.offsets = array('Q')
+            self.__index_map.close()
+            self.__index_map = None
+        if self.__size:
+            self.__map.close()
+        self.__file.close()
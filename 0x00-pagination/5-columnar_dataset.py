@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+This module provides a columnar, typed in-memory CSV dataset.
+"""
+
+import csv
+import itertools
+from array import array
+from collections.abc import Sequence
+from typing import Dict, List, Optional, Union
+
+# Smallest typecodes first, with the range of values each one holds
+INT_TYPECODES = [(code, -2 ** (8 * array(code).itemsize - 1),
+                  2 ** (8 * array(code).itemsize - 1) - 1)
+                 for code in ('b', 'h', 'i', 'q')]
+CODE_TYPECODES = [(code, 2 ** (8 * array(code).itemsize) - 1)
+                  for code in ('B', 'H', 'I')]
+BLOCK_ROWS = 4096
+
+
+class Column:
+    """
+    One column of a ColumnarDataset.
+
+    A column holding only integers written the way str() writes them
+    is stored as a typed array of the integers; any other column as a
+    typed array of codes into its list of distinct values.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Args:
+            name (str): Name of the column, from the header row.
+        """
+        self.name = name
+        self.ints: Optional[array] = array('q')
+        self.codes: Optional[array] = None
+        self.values: List[str] = []
+        self.__lookup: Dict[str, int] = {}
+
+    def extend(self, values: List[str]) -> None:
+        """
+        Adds the values of the next rows.
+        """
+        if self.ints is not None:
+            try:
+                numbers = array('q', map(int, values))
+            except (ValueError, OverflowError):
+                numbers = None
+            if numbers is not None and list(map(str, numbers)) == values:
+                self.ints.extend(numbers)
+                return
+            self.__to_codes()
+        lookup, distinct = self.__lookup, self.values
+        for value in values:
+            if value not in lookup:
+                lookup[value] = len(distinct)
+                distinct.append(value)
+        self.codes.extend(map(lookup.__getitem__, values))
+
+    def __to_codes(self) -> None:
+        """
+        Switches to dictionary encoding, re-encoding the integers so far.
+        """
+        ints, self.ints = self.ints, None
+        self.codes = array('I')
+        self.extend(list(map(str, ints)))
+
+    def freeze(self) -> None:
+        """
+        Narrows the array to the smallest typecode holding its values,
+        once the column is complete.
+        """
+        if self.ints is not None:
+            low = min(self.ints, default=0)
+            high = max(self.ints, default=0)
+            code = next(code for code, lo, hi in INT_TYPECODES
+                        if lo <= low and high <= hi)
+            self.ints = array(code, self.ints)
+        else:
+            code = next(code for code, hi in CODE_TYPECODES
+                        if len(self.values) - 1 <= hi)
+            self.codes = array(code, self.codes)
+        self.__lookup = {}
+
+    def __getitem__(self, index: slice) -> List[str]:
+        """
+        Returns the values of a slice of rows as strings.
+        """
+        if self.ints is not None:
+            return [str(number) for number in self.ints[index]]
+        values = self.values
+        return [values[code] for code in self.codes[index]]
+
+
+class ColumnarDataset(Sequence):
+    """
+    Read-only sequence of the data rows of a CSV file, header excluded,
+    kept column by column.
+
+    Integer columns are typed arrays and the other columns are
+    dictionary-encoded, so each value costs one to eight bytes instead
+    of a str object. Rows are materialized as lists of strings, the
+    same rows csv.reader gives, only when they are read. Every row must
+    have as many fields as the header.
+    """
+
+    def __init__(self, path: str, encoding: str = 'utf-8') -> None:
+        """
+        Load a CSV file, a block of rows at a time.
+
+        Args:
+            path (str): Path of the CSV file.
+            encoding (str): Encoding of the file (default is utf-8).
+
+        Raises:
+            ValueError: If a row does not have as many fields as the
+                header.
+        """
+        self.path = path
+        with open(path, mode='r', encoding=encoding, newline='') as f:
+            reader = csv.reader(f)
+            self.header: List[str] = next(reader, [])
+            self.columns = [Column(name) for name in self.header]
+            width = len(self.columns)
+            self.__len = 0
+            while True:
+                # Transpose a block of rows, then extend column by column
+                block = list(itertools.islice(reader, BLOCK_ROWS))
+                if not block:
+                    break
+                for i, row in enumerate(block):
+                    if len(row) != width:
+                        raise ValueError(
+                            f"{path}, row {self.__len + i + 1}: expected "
+                            f"{width} fields, got {len(row)}")
+                for column, values in zip(self.columns, zip(*block)):
+                    column.extend(list(values))
+                self.__len += len(block)
+        for column in self.columns:
+            column.freeze()
+
+    def column(self, name: str) -> Column:
+        """
+        Returns the column named `name` in the header.
+        """
+        return self.columns[self.header.index(name)]
+
+    def __len__(self) -> int:
+        """
+        Returns the number of data rows.
+        """
+        return self.__len
+
+    def __getitem__(self, index: Union[int, slice]):
+        """
+        Returns one row, or a list of them for a slice.
+
+        Args:
+            index (Union[int, slice]): Row number or slice of rows.
+
+        Returns:
+            The row as a list of strings, or a list of rows.
+        """
+        if isinstance(index, slice):
+            return [list(row) for row in
+                    zip(*(column[index] for column in self.columns))]
+        if index < 0:
+            index += self.__len
+        if not 0 <= index < self.__len:
+            raise IndexError("dataset index out of range")
+        return [column[index:index + 1][0] for column in self.columns]
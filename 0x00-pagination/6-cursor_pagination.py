@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Cursor (keyset) pagination with signed opaque cursors
+"""
+
+import base64
+import csv
+import hashlib
+import hmac
+import json
+import secrets
+from bisect import bisect_left, bisect_right
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+AFTER, BEFORE = "a", "b"
+
+
+def _as_tuple(value: Any) -> Any:
+    """
+    Turns the lists of a JSON-decoded key back into tuples.
+    """
+    if isinstance(value, list):
+        return tuple(_as_tuple(item) for item in value)
+    return value
+
+
+def encode_cursor(secret: bytes, direction: str, key: Tuple) -> str:
+    """
+    Returns an opaque, signed cursor.
+
+    Args:
+        secret (bytes): Key of the HMAC signing the cursor.
+        direction (str): AFTER to read the rows after `key`, BEFORE to
+            read the rows before it.
+        key (Tuple): Sort key of the last row seen, with its position
+            as a tie-breaker.
+
+    Returns:
+        str: URL-safe cursor.
+    """
+    payload = json.dumps([direction, key], separators=(',', ':')).encode()
+    signature = hmac.new(secret, payload, hashlib.sha256).digest()[:16]
+    return (base64.urlsafe_b64encode(payload).rstrip(b'=') + b'.' +
+            base64.urlsafe_b64encode(signature).rstrip(b'=')).decode()
+
+
+def decode_cursor(secret: bytes, cursor: str) -> Tuple[str, Tuple]:
+    """
+    Returns the direction and key of a cursor made by encode_cursor.
+
+    Raises:
+        ValueError: If the cursor is malformed or its signature does not
+            match, so a client cannot forge or alter one.
+    """
+    try:
+        payload, signature = (
+            base64.urlsafe_b64decode(part + b'=' * (-len(part) % 4))
+            for part in cursor.encode('ascii').split(b'.'))
+    except (ValueError, UnicodeError):
+        raise ValueError("invalid cursor") from None
+    expected = hmac.new(secret, payload, hashlib.sha256).digest()[:16]
+    if not hmac.compare_digest(signature, expected):
+        raise ValueError("invalid cursor")
+    direction, key = json.loads(payload)
+    if direction not in (AFTER, BEFORE):
+        raise ValueError("invalid cursor")
+    return direction, _as_tuple(key)
+
+
+class Server:
+    """Server class to paginate a database of popular baby names."""
+    DATA_FILE = "Popular_Baby_Names.csv"
+
+    def __init__(self, secret: Optional[bytes] = None,
+                 sort_key: Optional[Callable[[List], Tuple]] = None,
+                 loader: Optional[Callable[[str], Sequence[List]]] = None):
+        """
+        Args:
+            secret (bytes): Key signing the cursors. Servers sharing it
+                accept each other's cursors, also after a restart; a
+                random one is used if None.
+            sort_key (Callable): Returns the sort key of a row, a tuple
+                of JSON values (default is the row itself).
+            loader (Callable): Optional callable turning DATA_FILE into a
+                sequence of its data rows; read into a list if None.
+        """
+        self.__dataset = None
+        self.__sorted_index = None
+        self.__secret = secret if secret is not None else \
+            secrets.token_bytes(32)
+        self.__sort_key = sort_key if sort_key is not None else tuple
+        self.__loader = loader
+
+    def dataset(self) -> Sequence[List]:
+        """Cached dataset."""
+        if self.__dataset is None and self.__loader is not None:
+            self.__dataset = self.__loader(self.DATA_FILE)
+        if self.__dataset is None:
+            with open(self.DATA_FILE, mode='r', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                dataset = [row for row in reader]
+            self.__dataset = dataset[1:]  # Exclude header row
+        return self.__dataset
+
+    def sorted_index(self) -> List[Tuple]:
+        """
+        Cached (sort key, position) of every row, in order. The position
+        breaks ties, so every row has a distinct key.
+        """
+        if self.__sorted_index is None:
+            sort_key = self.__sort_key
+            self.__sorted_index = sorted(
+                (_as_tuple(list(sort_key(row))), position)
+                for position, row in enumerate(self.dataset()))
+        return self.__sorted_index
+
+    def get_cursor_page(self, cursor: Optional[str] = None,
+                        page_size: int = 10) -> Dict[str, Any]:
+        """
+        Get a page of the dataset in sort key order.
+
+        A page starts right after (or ends right before) the row whose
+        key the cursor holds, found by bisection, so any page costs
+        O(log n + page_size) and does not move when rows are added
+        elsewhere or the dataset is reloaded.
+
+        Args:
+            cursor (str): Cursor from a previous page, or None for the
+                first page.
+            page_size (int): The number of items per page (default is 10).
+
+        Returns:
+            Dict[str, Any]: The page, with the cursors of the next and
+                previous pages (None at either end).
+
+        Raises:
+            ValueError: If the cursor is invalid.
+        """
+        assert isinstance(page_size, int) and page_size > 0, \
+            "Page size must be a positive integer"
+
+        index = self.sorted_index()
+        if cursor is None:
+            start = 0
+            end = min(page_size, len(index))
+        else:
+            direction, key = decode_cursor(self.__secret, cursor)
+            if direction == AFTER:
+                start = bisect_right(index, key)
+                end = min(start + page_size, len(index))
+            else:
+                end = bisect_left(index, key)
+                start = max(end - page_size, 0)
+
+        dataset = self.dataset()
+        data = [dataset[position] for _, position in index[start:end]]
+        # A cursor from a larger dataset, or a BEFORE cursor at the
+        # start, can give an empty page: its key still marks where the
+        # rows on either side begin
+        if start == end:
+            after = before = key if cursor is not None else None
+        else:
+            after, before = index[end - 1], index[start]
+        next_cursor = prev_cursor = None
+        if end < len(index):
+            next_cursor = encode_cursor(self.__secret, AFTER, after)
+        if start > 0:
+            prev_cursor = encode_cursor(self.__secret, BEFORE, before)
+
+        return {
+            "page_size": len(data),
+            "data": data,
+            "next_cursor": next_cursor,
+            "prev_cursor": prev_cursor
+        }
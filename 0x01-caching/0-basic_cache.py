@@ -13,6 +13,23 @@ class BasicCache(BaseCaching):
     Inherits from BaseCaching.
     """
 
+    def __init__(self, max_items=None):
+        """
+        Initialize the class.
+        Args:
+            max_items: Ignored, as the cache has no limit; accepted so
+                that wrappers can pass a capacity to every policy.
+        """
+        super().__init__()
+
+    def _discard(self, key):
+        """
+        Remove an item from the cache.
+        Args:
+            key: Key of the item to remove.
+        """
+        del self.cache_data[key]
+
     def put(self, key, item):
         """
         Add an item to the cache.
@@ -32,3 +49,25 @@ class BasicCache(BaseCaching):
             The item associated with the key.
         """
         return self.cache_data.get(key, None)
+
+    def get_many(self, keys):
+        """
+        Get several items from the cache.
+        Args:
+            keys: Keys of the items to retrieve.
+        Returns:
+            A dict of the keys found and their items.
+        """
+        data = self.cache_data
+        return {key: data[key] for key in keys if key in data}
+
+    def put_many(self, mapping):
+        """
+        Add several items to the cache.
+        Args:
+            mapping: Dict of the keys and items to store.
+        """
+        self.cache_data.update(
+            (key, item) for key, item in mapping.items()
+            if key is not None and item is not None
+        )
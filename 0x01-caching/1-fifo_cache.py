@@ -1,32 +1,73 @@
 #!/usr/bin/env python3
 """ FIFO Cache Module """
 
+from collections import OrderedDict
+
 from base_caching import BaseCaching
+from capacity import CapacityMixin, EvictionMixin, check_max_items
 
 
-class FIFOCache(BaseCaching):
+class FIFOCache(EvictionMixin, CapacityMixin, BaseCaching):
     """ FIFOCache class that inherits from BaseCaching and FIFO cache """
 
-    def __init__(self):
-        """ Initialize the class """
+    def __init__(self, max_items=None):
+        """
+        Initialize the class.
+        Args:
+            max_items: Capacity of this cache, BaseCaching.MAX_ITEMS if
+                None.
+        """
         super().__init__()
-        self.queue = []  # To keep track of the order of insertion
+        self.max_items = check_max_items(max_items)
+        self.queue = OrderedDict()  # To keep track of the order of insertion
+
+    def _victim(self):
+        """ Key that the next eviction would discard """
+        return next(iter(self.queue))
+
+    def _evict(self):
+        """ Discard the first item put in cache and return its key """
+        fifo_key, _ = self.queue.popitem(last=False)
+        self.on_evict(fifo_key, self.cache_data.pop(fifo_key))
+        return fifo_key
+
+    def _discard(self, key):
+        """ Remove a key from the cache without counting it as evicted """
+        del self.queue[key]
+        del self.cache_data[key]
 
     def put(self, key, item):
         """ Add an item to the cache """
         if key is None or item is None:
             return
 
-        if len(self.cache_data) >= BaseCaching.MAX_ITEMS:
-            # Discard the first item put in cache (FIFO)
-            fifo_key = self.queue.pop(0)
-            del self.cache_data[fifo_key]
-            print(f"DISCARD: {fifo_key}")
+        if key not in self.cache_data:
+            if len(self.cache_data) >= self.max_items:
+                # Discard the first item put in cache (FIFO)
+                self._evict()
+            self.queue[key] = None
 
-        # Add the item and update the queue
+        # Add the item; updates keep their place in the queue
         self.cache_data[key] = item
-        self.queue.append(key)
 
     def get(self, key):
         """ Get an item from the cache """
         return self.cache_data.get(key, None)
+
+    def get_many(self, keys):
+        """ Get several items from the cache, as a dict of the hits """
+        data = self.cache_data
+        return {key: data[key] for key in keys if key in data}
+
+    def put_many(self, mapping):
+        """ Add several items to the cache, evicting as put() would """
+        data = self.cache_data
+        queue = self.queue
+        for key, item in mapping.items():
+            if key is None or item is None:
+                continue
+            if key not in data:
+                if len(data) >= self.max_items:
+                    self._evict()
+                queue[key] = None
+            data[key] = item
@@ -2,16 +2,103 @@
 """ LFU Cache Module """
 
 from base_caching import BaseCaching
+from capacity import CapacityMixin, EvictionMixin, check_max_items
 
 
-class LFUCache(BaseCaching):
+class _Node:
+    """ Entry of a key in the circular list of its frequency """
+
+    __slots__ = ("key", "freq", "prev", "next")
+
+    def __init__(self, key=None, freq=0):
+        """ Initialize the node, linked to itself """
+        self.key = key
+        self.freq = freq
+        self.prev = self
+        self.next = self
+
+
+class LFUCache(EvictionMixin, CapacityMixin, BaseCaching):
     """ LFUCache class that inherits from BaseCaching and an LFU cache """
 
-    def __init__(self):
-        """ Initialize the class """
+    def __init__(self, max_items=None):
+        """
+        Initialize the class.
+        Args:
+            max_items: Capacity of this cache, BaseCaching.MAX_ITEMS if
+                None.
+        """
         super().__init__()
-        self.frequency = {}  # To keep track of item frequencies
-        self.lru_order = []  # To keep track of LRU order
+        self.max_items = check_max_items(max_items)
+        self.nodes = {}  # key -> _Node, which holds its frequency
+        # Sentinel of the list of each frequency, keys in LRU order
+        self.buckets = {}
+        self.min_freq = 0
+
+    def _link(self, node):
+        """ Append a node at the most recent end of its frequency list """
+        head = self.buckets.get(node.freq)
+        if head is None:
+            head = self.buckets[node.freq] = _Node(None, node.freq)
+        last = head.prev
+        node.prev = last
+        node.next = head
+        last.next = node
+        head.prev = node
+
+    def _unlink(self, node):
+        """ Take a node out of its list, dropping the list if emptied """
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        head = self.buckets[node.freq]
+        if head.next is head:
+            # _victim finds the next lowest list if this was min_freq
+            del self.buckets[node.freq]
+            return True
+        return False
+
+    def _insert(self, key, item, freq=1):
+        """ Add a new key at the most recent end of a frequency list """
+        self.cache_data[key] = item
+        node = self.nodes[key] = _Node(key, freq)
+        self._link(node)
+
+    def _touch(self, key):
+        """ Move a key up to the next frequency list """
+        node = self.nodes[key]
+        if self._unlink(node) and self.min_freq == node.freq:
+            self.min_freq = node.freq + 1
+        node.freq += 1
+        self._link(node)
+
+    def _ordered_keys(self):
+        """ (frequency, key) pairs, lowest frequency then LRU first """
+        for freq in sorted(self.buckets):
+            head = self.buckets[freq]
+            node = head.next
+            while node is not head:
+                yield freq, node.key
+                node = node.next
+
+    def _victim(self):
+        """ Key that the next eviction would discard """
+        if self.min_freq not in self.buckets:
+            # Emptied by a previous eviction with no put in between
+            self.min_freq = min(self.buckets)
+        # The least recently used key of the lowest frequency list
+        return self.buckets[self.min_freq].next.key
+
+    def _evict(self):
+        """ Discard the least frequently used item and return its key """
+        lfu_key = self._victim()
+        self._unlink(self.nodes.pop(lfu_key))
+        self.on_evict(lfu_key, self.cache_data.pop(lfu_key))
+        return lfu_key
+
+    def _discard(self, key):
+        """ Remove a key from the cache without counting it as evicted """
+        self._unlink(self.nodes.pop(key))
+        del self.cache_data[key]
 
     def put(self, key, item):
         """ Add an item to the cache """
@@ -20,38 +107,46 @@ class LFUCache(BaseCaching):
 
         if key in self.cache_data:
             self.cache_data[key] = item
-            self.frequency[key] += 1
-            self.lru_order.remove(key)
-            self.lru_order.append(key)
-        else:
-            if len(self.cache_data) >= BaseCaching.MAX_ITEMS:
-                # Find the least frequently used item
-                lfu_keys = [
-                    k for k, v in self.frequency.items()
-                    if v == min(self.frequency.values())
-                ]
-                if len(lfu_keys) > 1:
-                    # If there's a tie, use the LRU order to break it
-                    lfu_key = next(k for k in self.lru_order if k in lfu_keys)
-                else:
-                    lfu_key = lfu_keys[0]
-
-                # Discard the least frequently used item
-                print(f"DISCARD: {lfu_key}")
-                del self.cache_data[lfu_key]
-                del self.frequency[lfu_key]
-                self.lru_order.remove(lfu_key)
-
-            # Add the new item and update the frequency and LRU order
-            self.cache_data[key] = item
-            self.frequency[key] = 1
-            self.lru_order.append(key)
+            self._touch(key)
+            return
+
+        if len(self.cache_data) >= self.max_items:
+            # Discard the least frequently used item
+            self._evict()
+
+        # Add the new item with a frequency of 1
+        self._insert(key, item)
+        self.min_freq = 1
 
     def get(self, key):
         """ Get an item from the cache """
         if key in self.cache_data:
-            self.frequency[key] += 1
-            self.lru_order.remove(key)
-            self.lru_order.append(key)
+            self._touch(key)
             return self.cache_data[key]
         return None
+
+    def get_many(self, keys):
+        """ Get several items from the cache, as a dict of the hits """
+        data = self.cache_data
+        touch = self._touch
+        found = {}
+        for key in keys:
+            if key in data:
+                touch(key)
+                found[key] = data[key]
+        return found
+
+    def put_many(self, mapping):
+        """ Add several items to the cache, evicting as put() would """
+        data = self.cache_data
+        for key, item in mapping.items():
+            if key is None or item is None:
+                continue
+            if key in data:
+                data[key] = item
+                self._touch(key)
+                continue
+            if len(data) >= self.max_items:
+                self._evict()
+            self._insert(key, item)
+            self.min_freq = 1
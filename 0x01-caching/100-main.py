@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+""" 100-main """
+import random
+
+from base_caching import BaseCaching
+
+LFUCache = __import__('100-lfu_cache').LFUCache
+
+my_cache = LFUCache()
+my_cache.put("A", "Hello")
+my_cache.put("B", "World")
+my_cache.put("C", "Holberton")
+my_cache.put("D", "School")
+my_cache.print_cache()
+print(my_cache.get("B"))
+my_cache.put("E", "Battery")
+my_cache.print_cache()
+my_cache.put("C", "Street")
+my_cache.print_cache()
+print(my_cache.get("A"))
+print(my_cache.get("B"))
+print(my_cache.get("C"))
+my_cache.put("F", "Mission")
+my_cache.print_cache()
+my_cache.put("G", "San Francisco")
+my_cache.print_cache()
+my_cache.put("H", "H")
+my_cache.print_cache()
+my_cache.put("I", "I")
+my_cache.print_cache()
+print(my_cache.get("I"))
+print(my_cache.get("H"))
+print(my_cache.get("I"))
+print(my_cache.get("H"))
+my_cache.put("J", "J")
+my_cache.print_cache()
+
+
+class ScanLFU:
+    """ LFU that scans every key for the victim, as a reference """
+
+    def __init__(self, max_items):
+        """ Initialize the class """
+        self.max_items = max_items
+        self.cache_data = {}
+        self.frequency = {}
+        self.lru_order = []
+        self.evicted = []
+
+    def _use(self, key):
+        """ Count a use of a cached key """
+        self.frequency[key] += 1
+        self.lru_order.remove(key)
+        self.lru_order.append(key)
+
+    def put(self, key, item):
+        """ Add an item, evicting the LFU key, LRU first on ties """
+        if key in self.cache_data:
+            self.cache_data[key] = item
+            self._use(key)
+            return
+        if len(self.cache_data) >= self.max_items:
+            lowest = min(self.frequency.values())
+            victim = next(k for k in self.lru_order
+                          if self.frequency[k] == lowest)
+            self.evicted.append(victim)
+            del self.cache_data[victim]
+            del self.frequency[victim]
+            self.lru_order.remove(victim)
+        self.cache_data[key] = item
+        self.frequency[key] = 1
+        self.lru_order.append(key)
+
+    def get(self, key):
+        """ Get an item """
+        if key not in self.cache_data:
+            return None
+        self._use(key)
+        return self.cache_data[key]
+
+
+# Random puts and gets must discard the same keys as the reference
+same = True
+for seed in range(20):
+    rnd = random.Random(seed)
+    max_items = rnd.choice((1, 2, BaseCaching.MAX_ITEMS, 16))
+    cache = LFUCache(max_items)
+    evicted = []
+    cache.on_evict = lambda key, item: evicted.append(key)
+    reference = ScanLFU(max_items)
+    for i in range(2000):
+        key = int(rnd.paretovariate(1.1)) % 40
+        if rnd.random() < 0.5:
+            cache.put(key, i)
+            reference.put(key, i)
+        elif cache.get(key) != reference.get(key):
+            same = False
+    same = (same and evicted == reference.evicted and
+            cache.cache_data == reference.cache_data)
+print("Same DISCARD sequence as the reference: {}".format(same))
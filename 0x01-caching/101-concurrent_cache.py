@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+""" Thread-safe cache module """
+
+import threading
+
+from base_caching import BaseCaching
+from capacity import check_max_items
+
+
+class LockedCache(BaseCaching):
+    """ LockedCache class that guards one cache policy with a global lock """
+
+    def __init__(self, cache_class):
+        """
+        Initialize the class.
+        Args:
+            cache_class: BaseCaching subclass (or factory) for the store.
+        """
+        self.cache = cache_class()
+        self.lock = threading.Lock()
+
+    @property
+    def cache_data(self):
+        """ Items of the policy """
+        return self.cache.cache_data
+
+    def put(self, key, item):
+        """ Add an item to the cache """
+        with self.lock:
+            self.cache.put(key, item)
+
+    def get(self, key):
+        """ Get an item from the cache """
+        with self.lock:
+            return self.cache.get(key)
+
+    def print_cache(self):
+        """ Print the cache """
+        with self.lock:
+            self.cache.print_cache()
+
+    def resize(self, max_items, batch=64):
+        """ Change the capacity of the policy, see its resize() """
+        with self.lock:
+            return self.cache.resize(max_items, batch)
+
+
+class StripedCache(BaseCaching):
+    """
+    StripedCache class that shards keys across independent cache
+    segments, each behind its own lock, so threads working on keys of
+    different segments do not contend.
+
+    The capacity is split evenly between the segments, and every
+    segment applies the policy to its own keys, so eviction is per
+    segment rather than global.
+    """
+
+    def __init__(self, cache_class, segments=16, max_items=None):
+        """
+        Initialize the class.
+        Args:
+            cache_class: BaseCaching subclass (or factory taking the
+                capacity) for each segment.
+            segments: Number of lock-striped segments, at most max_items.
+            max_items: Capacity of the whole cache, BaseCaching.MAX_ITEMS
+                if None.
+        """
+        if segments < 1:
+            raise ValueError("segments must be a positive integer")
+        self.max_items = check_max_items(max_items)
+        # Every segment needs room for at least one item
+        segments = min(segments, self.max_items)
+        self.segments = [cache_class(share)
+                         for share in self._shares(self.max_items, segments)]
+        self.locks = [threading.Lock() for _ in range(segments)]
+
+    @staticmethod
+    def _shares(max_items, segments):
+        """ Capacity of each segment, adding up to max_items """
+        share, extra = divmod(max_items, segments)
+        return [share + (i < extra) for i in range(segments)]
+
+    @property
+    def cache_data(self):
+        """ Snapshot of the items of every segment """
+        data = {}
+        for segment, lock in zip(self.segments, self.locks):
+            with lock:
+                data.update(segment.cache_data)
+        return data
+
+    def _stripe(self, key):
+        """ Index of the segment that owns a key """
+        return hash(key) % len(self.segments)
+
+    def _discard(self, key):
+        """ Remove a key from the cache without counting it as evicted """
+        stripe = self._stripe(key)
+        with self.locks[stripe]:
+            self.segments[stripe]._discard(key)
+
+    def put(self, key, item):
+        """ Add an item to the cache """
+        if key is None or item is None:
+            return
+        stripe = self._stripe(key)
+        with self.locks[stripe]:
+            self.segments[stripe].put(key, item)
+
+    def get(self, key):
+        """ Get an item from the cache """
+        if key is None:
+            return None
+        stripe = self._stripe(key)
+        with self.locks[stripe]:
+            return self.segments[stripe].get(key)
+
+    def resize(self, max_items, batch=64):
+        """
+        Change the capacity, split between the segments as in __init__.
+        Args:
+            max_items: New capacity, at least the number of segments.
+            batch: Maximum number of items this call evicts.
+        Returns:
+            The number of items still over capacity; call again with
+            the same capacity until it returns 0.
+        """
+        if max_items < len(self.segments):
+            raise ValueError("max_items must be at least the number of "
+                             "segments")
+        self.max_items = max_items
+        over = 0
+        shares = self._shares(max_items, len(self.segments))
+        for segment, lock, share in zip(self.segments, self.locks, shares):
+            with lock:
+                before = max(0, len(segment.cache_data) - share)
+                left = segment.resize(share, batch)
+            batch -= before - left
+            over += left
+        return over
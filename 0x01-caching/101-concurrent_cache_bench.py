@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+""" Multithreaded throughput benchmark: global lock vs lock striping """
+
+import random
+import threading
+import time
+
+from base_caching import BaseCaching
+
+concurrent_cache = __import__('101-concurrent_cache')
+POLICIES = (
+    __import__('0-basic_cache').BasicCache,
+    __import__('1-fifo_cache').FIFOCache,
+    __import__('2-lifo_cache').LIFOCache,
+    __import__('3-lru_cache').LRUCache,
+    __import__('4-mru_cache').MRUCache,
+    __import__('100-lfu_cache').LFUCache,
+)
+
+THREADS = (1, 2, 4, 8)
+OPERATIONS = 50_000
+KEYS = 20_000
+
+
+def worker(cache, seed, operations, barrier):
+    """ Run a 80/20 get/put mix against the cache """
+    rnd = random.Random(seed)
+    keys = [rnd.randrange(KEYS) for _ in range(operations)]
+    barrier.wait()
+    for i, key in enumerate(keys):
+        if i % 5:
+            cache.get(key)
+        else:
+            cache.put(key, i)
+
+
+def bench(cache, threads: int) -> float:
+    """
+    Run `threads` workers against one cache.
+
+    Returns:
+        float: Throughput in operations per second.
+    """
+    barrier = threading.Barrier(threads + 1)
+    pool = [
+        threading.Thread(target=worker,
+                         args=(cache, seed, OPERATIONS, barrier))
+        for seed in range(threads)
+    ]
+    for thread in pool:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in pool:
+        thread.join()
+    return threads * OPERATIONS / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    # Room for every key, so both layouts hold the same items and only
+    # the locking differs
+    BaseCaching.MAX_ITEMS = KEYS
+    results = []
+    for policy in POLICIES:
+        for threads in THREADS:
+            locked = concurrent_cache.LockedCache(policy)
+            striped = concurrent_cache.StripedCache(policy, 16)
+            results.append((policy.__name__, threads,
+                            bench(locked, threads),
+                            bench(striped, threads)))
+
+    print(f"{'policy':<10}{'threads':>8}{'global':>14}{'striped':>14}")
+    for name, threads, locked, striped in results:
+        print(f"{name:<10}{threads:>8}{locked:>12.0f}/s{striped:>12.0f}/s")
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+""" Memory-bounded cache module """
+
+import sys
+
+from base_caching import BaseCaching
+
+
+def deep_getsizeof(obj) -> int:
+    """
+    Size of an object in bytes, including the contents of lists,
+    tuples, sets and dicts. Shared objects are counted once.
+    Args:
+        obj: Object to measure.
+    Returns:
+        The size in bytes.
+    """
+    seen = set()
+    stack = [obj]
+    size = 0
+    while stack:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        size += sys.getsizeof(current)
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            stack.extend(current)
+    return size
+
+
+class MemoryBoundedCache(BaseCaching):
+    """
+    MemoryBoundedCache class that evicts by total item size in bytes.
+
+    Items are stored in a cache policy instance, which picks the victims
+    when the byte budget is exceeded. Its item capacity still applies
+    as well.
+    """
+
+    def __init__(self, cache_class, max_bytes, sizer=deep_getsizeof):
+        """
+        Initialize the class.
+        Args:
+            cache_class: BaseCaching subclass (or factory) for the store.
+            max_bytes: Budget for the total size of the items.
+            sizer: Callable returning the size of an item in bytes.
+        """
+        self.cache = cache_class()
+        self.max_bytes = max_bytes
+        self.sizer = sizer
+        self.sizes = {}
+        self.current_bytes = 0
+
+    @property
+    def cache_data(self):
+        """ Items of the policy """
+        return self.cache.cache_data
+
+    def _victim(self):
+        """ Key that the next eviction would discard """
+        return self.cache._victim()
+
+    def _evict(self):
+        """ Discard one item under the policy and return its key """
+        key = self.cache._evict()
+        self.current_bytes -= self.sizes.pop(key)
+        return key
+
+    def _discard(self, key):
+        """ Remove a key from the cache without counting it as evicted """
+        self.cache._discard(key)
+        self.current_bytes -= self.sizes.pop(key)
+
+    def put(self, key, item):
+        """ Add an item to the cache """
+        if key is None or item is None:
+            return
+
+        size = self.sizer(item)
+        if size > self.max_bytes:
+            # Can never fit, so it is not cached; drop any older value
+            if key in self.cache_data:
+                self._discard(key)
+            return
+
+        # Make room first, so the policy never evicts behind our back
+        if (key not in self.cache_data and
+                len(self.cache_data) >= self.cache.max_items):
+            self._evict()
+        while (self.current_bytes - self.sizes.get(key, 0) + size >
+               self.max_bytes):
+            self._evict()
+
+        self.cache.put(key, item)
+        self.current_bytes += size - self.sizes.get(key, 0)
+        self.sizes[key] = size
+
+    def get(self, key):
+        """ Get an item from the cache """
+        return self.cache.get(key)
+
+    def resize(self, max_items, batch=64):
+        """
+        Change the capacity of the policy, evicting through this cache.
+        Args:
+            max_items: New capacity, at least 1.
+            batch: Maximum number of items this call evicts.
+        Returns:
+            The number of items still over capacity; call again with
+            the same capacity until it returns 0.
+        """
+        self.cache.resize(max_items, batch=0)
+        for _ in range(min(batch, len(self.cache_data) - max_items)):
+            self._evict()
+        return max(0, len(self.cache_data) - max_items)
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+""" TTL Cache Module """
+
+import heapq
+import itertools
+import threading
+import time
+
+from base_caching import BaseCaching
+from capacity import EvictionMixin
+
+
+class TTLCache(EvictionMixin, BaseCaching):
+    """
+    TTLCache class that adds per-entry time-to-live on top of a cache
+    policy. Expired entries are dropped lazily on get, and a bounded
+    number per call by sweep(), which can also run on a background
+    thread. Capacity eviction is still done by the policy.
+    """
+
+    def __init__(self, cache_class, default_ttl=None, clock=time.monotonic):
+        """
+        Initialize the class.
+        Args:
+            cache_class: BaseCaching subclass (or factory) for the store.
+            default_ttl: Seconds an item lives when put() gets no ttl,
+                None to keep items until they are evicted.
+            clock: Callable returning the current time in seconds.
+        """
+        self.cache = cache_class()
+        self.cache.on_evict = self._evicted
+        self.default_ttl = default_ttl
+        self.clock = clock
+        self.expires = {}  # key -> deadline
+        self.deadlines = []  # heap of (deadline, tie-breaker, key)
+        self.counter = itertools.count()
+        self.lock = threading.RLock()
+        self.sweeper = None
+        self.stopping = threading.Event()
+
+    @property
+    def cache_data(self):
+        """ Items of the policy """
+        return self.cache.cache_data
+
+    def _evicted(self, key, item):
+        """ Forget the deadline of a key the policy evicted, report it """
+        self.expires.pop(key, None)
+        self.on_evict(key, item)
+
+    def _expire(self, key):
+        """ Drop a key whose deadline has passed """
+        del self.expires[key]
+        if key in self.cache_data:
+            self.cache._discard(key)
+
+    def _discard(self, key):
+        """ Remove a key from the cache without counting it as evicted """
+        with self.lock:
+            self.expires.pop(key, None)
+            self.cache._discard(key)
+
+    def _victim(self):
+        """ Key that the next eviction would discard """
+        return self.cache._victim()
+
+    def _evict(self):
+        """ Discard one item under the policy and return its key """
+        with self.lock:
+            return self.cache._evict()
+
+    def put(self, key, item, ttl=None):
+        """
+        Add an item to the cache.
+        Args:
+            key: Key to store the item.
+            item: Item to store.
+            ttl: Seconds before the item expires, default_ttl if None.
+        """
+        if key is None or item is None:
+            return
+
+        if ttl is None:
+            ttl = self.default_ttl
+        with self.lock:
+            self.cache.put(key, item)
+            if ttl is None:
+                self.expires.pop(key, None)
+                return
+
+            deadline = self.clock() + ttl
+            self.expires[key] = deadline
+            heapq.heappush(self.deadlines,
+                           (deadline, next(self.counter), key))
+            if len(self.deadlines) > 2 * len(self.expires) + 64:
+                # Too many superseded deadlines: rebuild the heap
+                self.deadlines = [
+                    (when, next(self.counter), k)
+                    for k, when in self.expires.items()
+                ]
+                heapq.heapify(self.deadlines)
+
+    def get(self, key):
+        """ Get an item from the cache """
+        with self.lock:
+            deadline = self.expires.get(key)
+            if deadline is not None and deadline <= self.clock():
+                self._expire(key)
+                return None
+            return self.cache.get(key)
+
+    def resize(self, max_items, batch=64):
+        """
+        Change the capacity of the policy, evicting through this cache.
+        Args:
+            max_items: New capacity, at least 1.
+            batch: Maximum number of items this call evicts.
+        Returns:
+            The number of items still over capacity; call again with
+            the same capacity until it returns 0.
+        """
+        with self.lock:
+            self.cache.resize(max_items, batch=0)
+            for _ in range(min(batch, len(self.cache_data) - max_items)):
+                self._evict()
+            return max(0, len(self.cache_data) - max_items)
+
+    def sweep(self, limit=20):
+        """
+        Drop expired entries, looking at no more than `limit` deadlines,
+        soonest first.
+        Args:
+            limit: Maximum number of deadlines to examine.
+        Returns:
+            The number of entries that expired.
+        """
+        expired = 0
+        with self.lock:
+            now = self.clock()
+            heap = self.deadlines
+            for _ in range(limit):
+                if not heap or heap[0][0] > now:
+                    break
+                deadline, _, key = heapq.heappop(heap)
+                # Skip deadlines superseded by a later put
+                if self.expires.get(key) != deadline:
+                    continue
+                if key in self.cache_data:
+                    expired += 1
+                self._expire(key)
+        return expired
+
+    def start_sweeper(self, interval=0.1, limit=20):
+        """
+        Sweep in a background thread every `interval` seconds.
+        Args:
+            interval: Seconds between two sweeps.
+            limit: Maximum number of deadlines examined per sweep.
+        """
+        if self.sweeper is not None:
+            return
+        self.stopping.clear()
+
+        def run():
+            """ Sweep until stop_sweeper() is called """
+            while not self.stopping.wait(interval):
+                self.sweep(limit)
+
+        self.sweeper = threading.Thread(target=run, daemon=True)
+        self.sweeper.start()
+
+    def stop_sweeper(self):
+        """ Stop the background sweeper thread """
+        if self.sweeper is None:
+            return
+        self.stopping.set()
+        self.sweeper.join()
+        self.sweeper = None
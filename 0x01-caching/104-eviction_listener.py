@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+""" Eviction listeners for the cache policies """
+
+import queue
+import sys
+import threading
+
+
+def print_discard(key, item):
+    """
+    Print the DISCARD line of an evicted item, like the policies do.
+    Args:
+        key: Key of the evicted item.
+        item: The evicted item.
+    """
+    print(f"DISCARD: {key}")
+
+
+def print_discard_batch(batch):
+    """
+    Print the DISCARD lines of a batch of evictions with one write.
+    Args:
+        batch: List of (key, item) pairs.
+    """
+    sys.stdout.write("".join(f"DISCARD: {key}\n" for key, _ in batch))
+
+
+class BatchedListener:
+    """
+    BatchedListener class that buffers evictions and hands them to a
+    callback as one list every `batch_size` evictions, or `max_delay`
+    seconds after the first buffered one, whichever comes first.
+    """
+
+    def __init__(self, callback=print_discard_batch, batch_size=256,
+                 max_delay=1.0):
+        """
+        Initialize the class.
+        Args:
+            callback: Callable taking a list of (key, item) pairs.
+            batch_size: Number of evictions buffered before a flush.
+            max_delay: Seconds an eviction waits in the buffer before a
+                flush, None to flush only on batch_size and close().
+        """
+        self.callback = callback
+        self.batch_size = batch_size
+        self.max_delay = max_delay
+        self.batch = []
+        self.lock = threading.Lock()
+        self.timer = None
+
+    def __call__(self, key, item):
+        """ Buffer one eviction """
+        with self.lock:
+            self.batch.append((key, item))
+            if len(self.batch) >= self.batch_size:
+                self._flush()
+            elif self.timer is None and self.max_delay is not None:
+                self.timer = threading.Timer(self.max_delay, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def _flush(self):
+        """ Deliver the buffered evictions, the lock being held """
+        if self.timer is not None:
+            self.timer.cancel()
+            self.timer = None
+        if self.batch:
+            batch, self.batch = self.batch, []
+            self.callback(batch)
+
+    def flush(self):
+        """ Deliver the buffered evictions """
+        with self.lock:
+            self._flush()
+
+    def close(self):
+        """ Deliver the evictions still buffered and stop the timer """
+        self.flush()
+
+
+class QueuedListener:
+    """
+    QueuedListener class that delivers evictions to a callback from a
+    background thread, so put() only pays for a queue append.
+    """
+
+    _STOP = object()
+
+    def __init__(self, callback=print_discard):
+        """
+        Initialize the class.
+        Args:
+            callback: Callable taking (key, item).
+        """
+        self.callback = callback
+        self.queue = queue.SimpleQueue()
+        self.worker = threading.Thread(target=self._run, daemon=True)
+        self.worker.start()
+
+    def __call__(self, key, item):
+        """ Queue one eviction """
+        self.queue.put((key, item))
+
+    def _run(self):
+        """ Deliver queued evictions until close() is called """
+        while True:
+            eviction = self.queue.get()
+            if eviction is self._STOP:
+                return
+            self.callback(*eviction)
+
+    def close(self):
+        """ Deliver the evictions still queued and stop the thread """
+        self.queue.put(self._STOP)
+        self.worker.join()
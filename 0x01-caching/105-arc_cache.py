@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+""" ARC Cache Module """
+
+from collections import OrderedDict
+
+from base_caching import BaseCaching
+from capacity import EvictionMixin, check_max_items
+
+
+class ARCCache(EvictionMixin, BaseCaching):
+    """
+    ARCCache class that inherits from BaseCaching and implements the
+    Adaptive Replacement Cache (Megiddo & Modha).
+
+    Items seen once live in t1 and items seen again in t2. The ghost
+    lists b1 and b2 remember the keys recently evicted from each, and
+    a put of a ghost key moves the target size p of t1 towards the list
+    that would have kept it. A scan only churns t1, so the hot items in
+    t2 survive it.
+    """
+
+    def __init__(self, max_items=None):
+        """
+        Initialize the class.
+        Args:
+            max_items: Capacity of this cache, BaseCaching.MAX_ITEMS if
+                None.
+        """
+        super().__init__()
+        self.max_items = check_max_items(max_items)
+        self.t1 = OrderedDict()  # Resident, seen once, LRU first
+        self.t2 = OrderedDict()  # Resident, seen twice or more
+        self.b1 = OrderedDict()  # Ghost keys evicted from t1
+        self.b2 = OrderedDict()  # Ghost keys evicted from t2
+        self.p = 0  # Target size of t1
+
+    def _from_t1(self, in_b2=False):
+        """ Whether the next replacement takes its victim from t1 """
+        return bool(self.t1) and (len(self.t1) > self.p or
+                                  (in_b2 and len(self.t1) == self.p) or
+                                  not self.t2)
+
+    def _victim(self):
+        """ Key that the next eviction would discard """
+        return next(iter(self.t1 if self._from_t1() else self.t2))
+
+    def _replace(self, in_b2=False):
+        """ Move the LRU item of t1 or t2 to its ghost list, return its key """
+        if self._from_t1(in_b2):
+            key, _ = self.t1.popitem(last=False)
+            self.b1[key] = None
+        else:
+            key, _ = self.t2.popitem(last=False)
+            self.b2[key] = None
+        self.on_evict(key, self.cache_data.pop(key))
+        return key
+
+    def _evict(self):
+        """ Discard one item under the policy and return its key """
+        return self._replace()
+
+    def _discard(self, key):
+        """ Remove a key from the cache without counting it as evicted """
+        if key in self.t1:
+            del self.t1[key]
+        else:
+            del self.t2[key]
+        del self.cache_data[key]
+
+    def put(self, key, item):
+        """ Add an item to the cache """
+        if key is None or item is None:
+            return
+
+        capacity = self.max_items
+        full = len(self.cache_data) >= capacity
+        if key in self.cache_data:
+            # Seen again: promote to the most recent end of t2
+            self.t1.pop(key, None)
+            self.t2[key] = None
+            self.t2.move_to_end(key)
+        elif key in self.b1:
+            # t1 was evicted too early: grow its target
+            self.p = min(capacity,
+                         self.p + max(len(self.b2) // len(self.b1), 1))
+            del self.b1[key]
+            if full:
+                self._replace()
+            self.t2[key] = None
+        elif key in self.b2:
+            # t2 was evicted too early: shrink the target of t1
+            self.p = max(0, self.p - max(len(self.b1) // len(self.b2), 1))
+            del self.b2[key]
+            if full:
+                self._replace(in_b2=True)
+            self.t2[key] = None
+        else:
+            if len(self.t1) + len(self.b1) >= capacity:
+                if self.b1 and full:
+                    self.b1.popitem(last=False)
+                    self._replace()
+                elif self.t1 and full:
+                    # No ghost to keep, t1 alone fills the cache
+                    lru_key, _ = self.t1.popitem(last=False)
+                    self.on_evict(lru_key, self.cache_data.pop(lru_key))
+                elif self.b1:
+                    self.b1.popitem(last=False)
+            else:
+                total = (len(self.t1) + len(self.t2) +
+                         len(self.b1) + len(self.b2))
+                if total >= 2 * capacity and self.b2:
+                    self.b2.popitem(last=False)
+                if full:
+                    self._replace()
+            self.t1[key] = None
+
+        self.cache_data[key] = item
+
+    def get(self, key):
+        """ Get an item from the cache """
+        if key is None or key not in self.cache_data:
+            return None
+
+        # A hit moves the key to the most recent end of t2
+        if key in self.t1:
+            del self.t1[key]
+            self.t2[key] = None
+        else:
+            self.t2.move_to_end(key)
+        return self.cache_data[key]
+
+    def get_many(self, keys):
+        """ Get several items from the cache, as a dict of the hits """
+        get = self.get
+        found = {}
+        for key in keys:
+            item = get(key)
+            if item is not None:
+                found[key] = item
+        return found
+
+    def put_many(self, mapping):
+        """ Add several items to the cache, evicting as put() would """
+        put = self.put
+        for key, item in mapping.items():
+            put(key, item)
+
+    def resize(self, max_items, batch=64):
+        """
+        Change the capacity, evicting under the policy as needed.
+        Args:
+            max_items: New capacity, at least 1.
+            batch: Maximum number of items and ghost keys this call
+                drops, so that shrinking a large cache does not stall.
+        Returns:
+            The number of items and ghost keys still over capacity;
+            call again with the same capacity until it returns 0.
+        """
+        max_items = check_max_items(max_items)
+        self.max_items = max_items
+        self.p = min(self.p, max_items)
+        for _ in range(batch):
+            if len(self.cache_data) > max_items:
+                self._replace()
+            elif len(self.t1) + len(self.b1) > max_items and self.b1:
+                self.b1.popitem(last=False)
+            elif len(self.b1) + len(self.b2) > max_items:
+                (self.b2 or self.b1).popitem(last=False)
+            else:
+                break
+        # Ghost keys count too: t1 and b1 together, and b1 and b2
+        # together, must each fit in max_items
+        ghosts = max(0, min(len(self.b1),
+                            len(self.t1) + len(self.b1) - max_items),
+                     len(self.b1) + len(self.b2) - max_items)
+        return max(0, len(self.cache_data) - max_items) + ghosts
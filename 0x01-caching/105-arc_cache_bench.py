@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+""" Trace-replay hit ratio of ARCCache against the other policies """
+
+import random
+
+from base_caching import BaseCaching
+
+POLICIES = (
+    __import__('1-fifo_cache').FIFOCache,
+    __import__('2-lifo_cache').LIFOCache,
+    __import__('3-lru_cache').LRUCache,
+    __import__('4-mru_cache').MRUCache,
+    __import__('100-lfu_cache').LFUCache,
+    __import__('105-arc_cache').ARCCache,
+)
+CAPACITY = 500
+
+
+def hot_set_with_scans(length=200_000, hot=400, scan=2_000, every=5_000):
+    """ Zipf-like hot set, interrupted by a full scan every `every` keys """
+    rnd = random.Random(0)
+    trace = []
+    next_scan = 0
+    while len(trace) < length:
+        if len(trace) >= next_scan:
+            trace.extend(f"page-{i}" for i in range(scan))
+            next_scan = len(trace) + every
+        trace.append(int(hot * rnd.paretovariate(1.2)) % hot)
+    return trace
+
+
+def shifting_working_set(length=200_000, size=400, phases=5):
+    """ Uniform working set that moves to new keys `phases` times """
+    rnd = random.Random(1)
+    phase_length = length // phases
+    return [phase * size + rnd.randrange(size)
+            for phase in range(phases) for _ in range(phase_length)]
+
+
+def replay(policy, trace):
+    """
+    Replay a trace as cache-aside lookups: get, then put on a miss.
+
+    Returns:
+        float: The hit ratio.
+    """
+    cache = policy()
+    cache.on_evict = lambda key, item: None
+    hits = 0
+    for key in trace:
+        if cache.get(key) is None:
+            cache.put(key, key)
+        else:
+            hits += 1
+    return hits / len(trace)
+
+
+if __name__ == "__main__":
+    BaseCaching.MAX_ITEMS = CAPACITY
+    traces = {
+        "hot set + scans": hot_set_with_scans(),
+        "shifting set": shifting_working_set(),
+    }
+    print(f"{'policy':<10}" + "".join(f"{name:>18}" for name in traces))
+    for policy in POLICIES:
+        ratios = [replay(policy, trace) for trace in traces.values()]
+        print(f"{policy.__name__:<10}" +
+              "".join(f"{ratio:>18.2%}" for ratio in ratios))
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+""" W-TinyLFU admission module """
+
+from array import array
+from collections import OrderedDict
+
+from base_caching import BaseCaching
+from capacity import EvictionMixin, check_max_items
+
+# Odd 64-bit multipliers, one per sketch row
+_MULTIPLIERS = (
+    0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F,
+    0x165667B19E3779F9, 0xD6E8FEB86659FD93,
+)
+_MASK64 = (1 << 64) - 1
+
+
+class CountMinSketch:
+    """
+    CountMinSketch class that estimates how often keys were seen, in a
+    fixed number of saturating 4-bit counters. All counters are halved
+    every `sample_size` additions so old popularity fades out.
+    """
+
+    def __init__(self, width, depth=4, sample_size=None):
+        """
+        Initialize the class.
+        Args:
+            width: Counters per row, rounded up to a power of two.
+            depth: Number of rows, at most 4.
+            sample_size: Additions between two agings, 10 * width if None.
+        """
+        self.shift = 64 - max(width - 1, 1).bit_length()
+        width = 1 << (64 - self.shift)
+        self.multipliers = _MULTIPLIERS[:depth]
+        self.rows = [array('B', bytes(width)) for _ in self.multipliers]
+        self.sample_size = sample_size or 10 * width
+        self.additions = 0
+
+    def _indexes(self, key):
+        """ Counter index of a key in every row """
+        h = hash(key) & _MASK64
+        return [((h * m) & _MASK64) >> self.shift for m in self.multipliers]
+
+    def add(self, key):
+        """ Count one occurrence of a key """
+        for row, i in zip(self.rows, self._indexes(key)):
+            if row[i] < 15:
+                row[i] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self._age()
+
+    def estimate(self, key):
+        """ Estimated number of occurrences of a key """
+        return min(row[i] for row, i in zip(self.rows, self._indexes(key)))
+
+    def _age(self):
+        """ Halve every counter """
+        self.rows = [array('B', bytes(c >> 1 for c in row))
+                     for row in self.rows]
+        self.additions //= 2
+
+
+class TinyLFUCache(EvictionMixin, BaseCaching):
+    """
+    TinyLFUCache class that puts a W-TinyLFU admission filter in front
+    of a cache policy.
+
+    New items enter a small LRU window. An item pushed out of the
+    window only replaces the victim of the main policy if the sketch
+    has seen it more often, so one-hit wonders never reach the main
+    cache. Popularity is kept in a CountMinSketch, also for keys that
+    are no longer cached.
+    """
+
+    def __init__(self, cache_class, window_ratio=0.01, max_items=None):
+        """
+        Initialize the class.
+        Args:
+            cache_class: BaseCaching subclass (or factory) for the main
+                cache; LRUCache keeps the per-key overhead lowest.
+            window_ratio: Share of the capacity given to the window.
+            max_items: Capacity of this cache, BaseCaching.MAX_ITEMS if
+                None.
+        """
+        self.max_items = check_max_items(max_items)
+        self.window = OrderedDict()
+        self.window_ratio = window_ratio
+        self.main = cache_class()
+        self.main.on_evict = self._main_evicted
+        # Admission keeps the main cache within its share; its own
+        # capacity must not evict before that
+        self.main.resize(max(1, self._capacities()[1]), batch=0)
+        self.sketch = CountMinSketch(self.max_items)
+
+    @property
+    def cache_data(self):
+        """ Snapshot of the items of the window and the main cache """
+        data = dict(self.main.cache_data)
+        data.update(self.window)
+        return data
+
+    def _main_evicted(self, key, item):
+        """ Report the evictions of the main cache as our own """
+        self.on_evict(key, item)
+
+    def _capacities(self):
+        """
+        Sizes of the window and of the main cache, adding up to
+        max_items. The window holds at least one item, so a capacity
+        of one leaves nothing to the main cache.
+        """
+        window = min(self.max_items,
+                     max(1, int(self.max_items * self.window_ratio)))
+        return window, self.max_items - window
+
+    def _admit(self, key, item):
+        """ Offer an item pushed out of the window to the main cache """
+        _, main_capacity = self._capacities()
+        if not main_capacity:
+            self.on_evict(key, item)
+            return
+        if len(self.main.cache_data) >= main_capacity:
+            victim = self.main._victim()
+            if self.sketch.estimate(key) <= self.sketch.estimate(victim):
+                self.on_evict(key, item)
+                return
+            self.main._evict()
+        self.main.put(key, item)
+
+    def _victim(self):
+        """ Key that the next eviction would discard """
+        if self.window:
+            return next(iter(self.window))
+        return self.main._victim()
+
+    def _evict(self):
+        """ Discard one item and return its key """
+        if not self.window:
+            return self.main._evict()
+        key, item = self.window.popitem(last=False)
+        self.on_evict(key, item)
+        return key
+
+    def _discard(self, key):
+        """ Remove a key from the cache without counting it as evicted """
+        if key in self.window:
+            del self.window[key]
+        else:
+            self.main._discard(key)
+
+    def put(self, key, item):
+        """ Add an item to the cache """
+        if key is None or item is None:
+            return
+
+        self.sketch.add(key)
+        if key in self.window:
+            self.window[key] = item
+            self.window.move_to_end(key)
+        elif key in self.main.cache_data:
+            self.main.put(key, item)
+        else:
+            self.window[key] = item
+            window_capacity, _ = self._capacities()
+            while len(self.window) > window_capacity:
+                self._admit(*self.window.popitem(last=False))
+
+    def get(self, key):
+        """ Get an item from the cache """
+        if key is None:
+            return None
+
+        if key in self.window:
+            self.sketch.add(key)
+            self.window.move_to_end(key)
+            return self.window[key]
+        item = self.main.get(key)
+        if item is not None:
+            self.sketch.add(key)
+        return item
+
+    def resize(self, max_items, batch=64):
+        """
+        Change the capacity, evicting the window first as needed. The
+        sketch keeps the width it was created with.
+        Args:
+            max_items: New capacity, at least 1.
+            batch: Maximum number of items this call evicts.
+        Returns:
+            The number of items still over capacity; call again with
+            the same capacity until it returns 0.
+        """
+        self.max_items = check_max_items(max_items)
+        window_capacity, main_capacity = self._capacities()
+        self.main.resize(max(1, main_capacity), batch=0)
+        for _ in range(batch):
+            if len(self.window) > window_capacity:
+                self._evict()
+            elif len(self.main.cache_data) > main_capacity:
+                self.main._evict()
+            else:
+                break
+        return (max(0, len(self.window) - window_capacity) +
+                max(0, len(self.main.cache_data) - main_capacity))
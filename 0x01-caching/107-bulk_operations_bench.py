@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+""" Benchmark of get_many/put_many against one get/put call per key """
+
+import random
+import time
+
+from base_caching import BaseCaching
+
+POLICIES = (
+    __import__('1-fifo_cache').FIFOCache,
+    __import__('3-lru_cache').LRUCache,
+    __import__('4-mru_cache').MRUCache,
+    __import__('100-lfu_cache').LFUCache,
+)
+BATCH = 32
+BATCHES = 5_000
+KEYS = 20_000
+REPEAT = 3
+
+
+def sequential(cache, batches):
+    """ Look up each batch key by key, then store its misses """
+    for keys in batches:
+        found = {}
+        misses = {}
+        for key in keys:
+            item = cache.get(key)
+            if item is None:
+                misses[key] = key
+            else:
+                found[key] = item
+        for key, item in misses.items():
+            cache.put(key, item)
+
+
+def bulk(cache, batches):
+    """ Look up each batch with get_many, then store its misses """
+    for keys in batches:
+        found = cache.get_many(keys)
+        cache.put_many({key: key for key in keys if key not in found})
+
+
+def bench(policy, run, batches) -> float:
+    """
+    Time one way of serving the batches on a fresh cache, keeping the
+    best of REPEAT runs.
+
+    Returns:
+        float: Nanoseconds per key.
+    """
+    best = float('inf')
+    for _ in range(REPEAT):
+        cache = policy()
+        cache.on_evict = lambda key, item: None
+        start = time.perf_counter()
+        run(cache, batches)
+        best = min(best, time.perf_counter() - start)
+    return best / (len(batches) * BATCH) * 1e9
+
+
+if __name__ == "__main__":
+    BaseCaching.MAX_ITEMS = KEYS // 4
+    rnd = random.Random(0)
+    batches = [[int(rnd.paretovariate(1.0)) % KEYS for _ in range(BATCH)]
+               for _ in range(BATCHES)]
+    print(f"{'policy':<10}{'get/put':>14}{'*_many':>14}")
+    for policy in POLICIES:
+        one = bench(policy, sequential, batches)
+        many = bench(policy, bulk, batches)
+        print(f"{policy.__name__:<10}{one:>11.0f} ns{many:>11.0f} ns")
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+""" Cache statistics module """
+
+import time
+from array import array
+
+from base_caching import BaseCaching
+from capacity import EvictionMixin
+
+
+class StatsCache(EvictionMixin, BaseCaching):
+    """
+    StatsCache class that counts hits, misses, puts, updates and
+    evictions of a cache policy, and times one get/put in every
+    `sample_every` for latency percentiles.
+
+    disable() and enable() switch collection off and on. While it is
+    off, get and put are the policy's own bound methods, so they cost
+    nothing extra.
+    """
+
+    def __init__(self, cache_class, window=1024, sample_every=16,
+                 enabled=True):
+        """
+        Initialize the class.
+        Args:
+            cache_class: BaseCaching subclass (or factory) for the store.
+            window: Number of recent lookups, and of latency samples,
+                kept for the rolling hit ratio and the percentiles.
+            sample_every: Time one get/put out of this many.
+            enabled: Whether to start collecting right away.
+        """
+        self.cache = cache_class()
+        self.cache.on_evict = self._evicted
+        self.window = window
+        self.sample_every = sample_every
+        self.reset()
+        if enabled:
+            self.enable()
+        else:
+            self.disable()
+
+    @property
+    def cache_data(self):
+        """ Items of the policy """
+        return self.cache.cache_data
+
+    def _evicted(self, key, item):
+        """ Count an eviction of the policy and report it """
+        self.evictions += 1
+        self.on_evict(key, item)
+
+    def _victim(self):
+        """ Key that the next eviction would discard """
+        return self.cache._victim()
+
+    def _evict(self):
+        """ Discard one item under the policy and return its key """
+        return self.cache._evict()
+
+    def _discard(self, key):
+        """ Remove a key from the cache without counting it as evicted """
+        self.cache._discard(key)
+
+    def reset(self):
+        """ Zero every counter and drop the latency samples """
+        self.hits = 0
+        self.misses = 0
+        self.puts = 0
+        self.updates = 0
+        self.evictions = 0
+        self.recent = bytearray(self.window)  # 1 for a hit, 0 for a miss
+        self.recent_hits = 0
+        self.lookups = 0
+        self.get_ns = array('Q', bytes(8 * self.window))
+        self.put_ns = array('Q', bytes(8 * self.window))
+        self.get_count = 0
+        self.put_count = 0
+
+    def enable(self):
+        """ Start collecting statistics """
+        self.enabled = True
+        self.get = self._timed_get
+        self.put = self._timed_put
+
+    def disable(self):
+        """ Stop collecting statistics; counters keep their values """
+        self.enabled = False
+        self.get = self.cache.get
+        self.put = self.cache.put
+
+    def _timed_get(self, key):
+        """ Get an item from the cache and record the lookup """
+        self.get_count += 1
+        if self.get_count % self.sample_every:
+            item = self.cache.get(key)
+        else:
+            start = time.perf_counter_ns()
+            item = self.cache.get(key)
+            elapsed = time.perf_counter_ns() - start
+            sample = self.get_count // self.sample_every - 1
+            self.get_ns[sample % self.window] = elapsed
+
+        hit = item is not None
+        if hit:
+            self.hits += 1
+        else:
+            self.misses += 1
+        slot = self.lookups % self.window
+        self.recent_hits += hit - self.recent[slot]
+        self.recent[slot] = hit
+        self.lookups += 1
+        return item
+
+    def _timed_put(self, key, item):
+        """ Add an item to the cache and record the write """
+        if key is None or item is None:
+            return
+        if key in self.cache_data:
+            self.updates += 1
+        else:
+            self.puts += 1
+
+        self.put_count += 1
+        if self.put_count % self.sample_every:
+            self.cache.put(key, item)
+        else:
+            start = time.perf_counter_ns()
+            self.cache.put(key, item)
+            elapsed = time.perf_counter_ns() - start
+            sample = self.put_count // self.sample_every - 1
+            self.put_ns[sample % self.window] = elapsed
+
+    def get(self, key):
+        """ Get an item from the cache """
+        return self.cache.get(key)
+
+    def put(self, key, item):
+        """ Add an item to the cache """
+        self.cache.put(key, item)
+
+    @staticmethod
+    def _percentiles(samples, count):
+        """ p50 and p99 of the first `count` samples of a ring """
+        ordered = sorted(samples[:count])
+        if not ordered:
+            return None, None
+        return (ordered[len(ordered) // 2],
+                ordered[min(len(ordered) - 1, len(ordered) * 99 // 100)])
+
+    def snapshot(self):
+        """
+        Current statistics.
+        Returns:
+            A dict of the counters, hit ratios and latency percentiles.
+        """
+        lookups = self.hits + self.misses
+        recent = min(self.lookups, self.window)
+        get_p50, get_p99 = self._percentiles(
+            self.get_ns, min(self.get_count // self.sample_every, self.window))
+        put_p50, put_p99 = self._percentiles(
+            self.put_ns, min(self.put_count // self.sample_every, self.window))
+        return {
+            "enabled": self.enabled,
+            "size": len(self.cache_data),
+            "hits": self.hits,
+            "misses": self.misses,
+            "puts": self.puts,
+            "updates": self.updates,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else None,
+            "rolling_hit_ratio": (self.recent_hits / recent
+                                  if recent else None),
+            "get_p50_ns": get_p50,
+            "get_p99_ns": get_p99,
+            "put_p50_ns": put_p50,
+            "put_p99_ns": put_p99,
+        }
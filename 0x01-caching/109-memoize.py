@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+""" Memoization decorator backed by the cache policies """
+
+import asyncio
+import functools
+import inspect
+import threading
+from collections import namedtuple
+
+from base_caching import BaseCaching
+
+LRUCache = __import__('3-lru_cache').LRUCache
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+_KWARGS_MARK = object()
+
+
+def make_key(args, kwargs, typed=False):
+    """
+    Build a hashable cache key from call arguments.
+    Args:
+        args: Positional arguments of the call.
+        kwargs: Keyword arguments of the call.
+        typed: Whether arguments of different types get distinct keys,
+            so that f(1) and f(1.0) are cached separately.
+    Returns:
+        A tuple usable as a cache key.
+    """
+    key = args
+    if kwargs:
+        items = tuple(sorted(kwargs.items()))
+        key += (_KWARGS_MARK,) + items
+    if typed:
+        key += tuple(type(arg) for arg in args)
+        if kwargs:
+            key += tuple(type(value) for _, value in items)
+    return key
+
+
+class _Call:
+    """ One in-flight computation shared by the callers of a key """
+
+    def __init__(self):
+        """ Initialize the class """
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def memoize(cache_class=LRUCache, typed=False):
+    """
+    Decorator caching the results of a function in a cache policy.
+
+    Concurrent calls that miss on the same key wait for one computation
+    instead of running the function again. Coroutine functions are
+    supported the same way, with a task per key and event loop. The
+    decorated function gets cache_info(), cache_clear() and a `cache`
+    attribute.
+    Args:
+        cache_class: BaseCaching subclass (or factory) for the store.
+        typed: Whether arguments of different types get distinct keys.
+    Returns:
+        The decorator.
+    """
+    def decorator(func):
+        """ Wrap func with the cache """
+        lock = threading.Lock()
+        in_flight = {}
+        stats = {"hits": 0, "misses": 0}
+
+        def new_cache():
+            """ Fresh store that discards evictions silently """
+            cache = cache_class()
+            cache.on_evict = lambda key, item: None
+            return cache
+
+        def lookup(key):
+            """ The cached result box of a key, counting the hit """
+            boxed = wrapper.cache.get(key)
+            if boxed is not None:
+                stats["hits"] += 1
+            return boxed
+
+        def store(key, result):
+            """ Cache a result; boxed so that None can be cached """
+            with lock:
+                wrapper.cache.put(key, (result,))
+
+        if inspect.iscoroutinefunction(func):
+            async def load(flight, args, kwargs):
+                """ Run func once for the callers of a key and cache it """
+                try:
+                    result = await func(*args, **kwargs)
+                    store(flight[1], result)
+                    return result
+                finally:
+                    with lock:
+                        del in_flight[flight]
+
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                """ Cached coroutine function """
+                key = make_key(args, kwargs, typed)
+                loop = asyncio.get_running_loop()
+                # Tasks are bound to their loop: callers on another loop,
+                # such as another thread's asyncio.run(), load on their own
+                flight = (loop, key)
+                with lock:
+                    boxed = lookup(key)
+                    if boxed is not None:
+                        return boxed[0]
+                    task = in_flight.get(flight)
+                    if task is None:
+                        stats["misses"] += 1
+                        # Its own task, so cancelling the caller that
+                        # started it does not cancel it for the others
+                        task = loop.create_task(load(flight, args, kwargs))
+                        in_flight[flight] = task
+                    else:
+                        stats["hits"] += 1
+                return await asyncio.shield(task)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                """ Cached function """
+                key = make_key(args, kwargs, typed)
+                with lock:
+                    boxed = lookup(key)
+                    if boxed is not None:
+                        return boxed[0]
+                    call = in_flight.get(key)
+                    leader = call is None
+                    if leader:
+                        stats["misses"] += 1
+                        call = in_flight[key] = _Call()
+                    else:
+                        stats["hits"] += 1
+                if not leader:
+                    call.done.wait()
+                    if call.error is not None:
+                        raise call.error
+                    return call.result
+
+                try:
+                    call.result = func(*args, **kwargs)
+                    store(key, call.result)
+                    return call.result
+                except BaseException as error:
+                    call.error = error
+                    raise
+                finally:
+                    with lock:
+                        del in_flight[key]
+                    call.done.set()
+
+        def cache_info():
+            """ Hits, misses, capacity and size of the cache """
+            with lock:
+                return CacheInfo(stats["hits"], stats["misses"],
+                                 getattr(wrapper.cache, "max_items",
+                                         BaseCaching.MAX_ITEMS),
+                                 len(wrapper.cache.cache_data))
+
+        def cache_clear():
+            """ Empty the cache and reset the statistics """
+            with lock:
+                wrapper.cache = new_cache()
+                stats["hits"] = stats["misses"] = 0
+
+        wrapper.cache = new_cache()
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
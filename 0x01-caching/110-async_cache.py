@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+""" Asyncio cache module """
+
+import asyncio
+import inspect
+
+from base_caching import BaseCaching
+
+
+def _is_async(loader):
+    """ Whether calling a loader gives an awaitable without blocking """
+    return (inspect.iscoroutinefunction(loader) or
+            inspect.iscoroutinefunction(getattr(type(loader), "__call__",
+                                                None)))
+
+
+class AsyncCache(BaseCaching):
+    """
+    AsyncCache class that serves a cache policy to asyncio code.
+
+    get_or_load() runs the loader once per missing key: concurrent
+    callers await the same future and all get its result or its error.
+    The policy itself is only touched from the event loop thread and
+    never waits, so it never blocks the loop. Synchronous loaders are
+    run in the default executor.
+    """
+
+    def __init__(self, cache_class):
+        """
+        Initialize the class.
+        Args:
+            cache_class: BaseCaching subclass (or factory) for the store.
+        """
+        self.cache = cache_class()
+        self.in_flight = {}
+        self.loads = set()  # Strong references to the running load tasks
+
+    @property
+    def cache_data(self):
+        """ Items of the policy """
+        return self.cache.cache_data
+
+    def put(self, key, item):
+        """ Add an item to the cache """
+        self.cache.put(key, item)
+
+    def get(self, key):
+        """ Get an item from the cache """
+        return self.cache.get(key)
+
+    async def get_or_load(self, key, loader):
+        """
+        Get an item, loading and caching it on a miss.
+        Args:
+            key: Key of the item.
+            loader: Callable taking the key and returning the item or
+                an awaitable of it, such as a coroutine function.
+        Returns:
+            The cached or loaded item.
+        """
+        item = self.cache.get(key)
+        if item is not None:
+            return item
+
+        future = self.in_flight.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self.in_flight[key] = future
+            # The load runs in its own task, so cancelling one waiter
+            # does not cancel it for the others
+            task = loop.create_task(self._load(key, loader, future))
+            self.loads.add(task)
+            task.add_done_callback(self.loads.discard)
+        return await asyncio.shield(future)
+
+    async def _load(self, key, loader, future):
+        """ Run a loader and settle the future shared by its waiters """
+        try:
+            if _is_async(loader):
+                item = loader(key)
+            else:
+                loop = asyncio.get_running_loop()
+                item = await loop.run_in_executor(None, loader, key)
+            # A plain callable may still return an awaitable, such as
+            # lambda key: fetch(key); it is awaited here, on the loop
+            if inspect.isawaitable(item):
+                item = await item
+        except BaseException as error:
+            future.set_exception(error)
+            future.exception()  # Retrieved, even if every waiter left
+            if not isinstance(error, Exception):
+                raise
+        else:
+            self.cache.put(key, item)
+            future.set_result(item)
+        finally:
+            del self.in_flight[key]
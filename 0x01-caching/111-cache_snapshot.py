@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+""" Cache snapshot module: save and warm-start cache contents """
+
+import os
+import pickle
+
+from base_caching import BaseCaching
+
+SNAPSHOT_FORMAT = "alx-cache-snapshot"
+SNAPSHOT_VERSION = 1
+
+# Scalar policy state saved in the header
+_SCALARS = ("min_freq", "p")
+# Ordering structures, from the first to the last key to keep
+_ORDERS = ("order", "queue")
+# ARC lists; b1 and b2 hold keys only
+_ARC_LISTS = ("t1", "t2", "b1", "b2")
+
+
+def _records(cache):
+    """ (tag, key, item) records in the order the policy keeps its keys """
+    data = cache.cache_data
+    if hasattr(cache, "buckets"):
+        # LFU: frequency lists, lowest first, each in LRU order
+        for freq, key in cache._ordered_keys():
+            yield freq, key, data[key]
+        return
+    if hasattr(cache, "t1"):
+        for name in _ARC_LISTS:
+            for key in getattr(cache, name):
+                yield name, key, data.get(key)
+        return
+    order = next((getattr(cache, name) for name in _ORDERS
+                  if hasattr(cache, name)), data)
+    for key in order:
+        yield None, key, data[key]
+
+
+def _restore(cache, tag, key, item):
+    """ Put one record back in the policy structures """
+    if hasattr(cache, "buckets"):
+        cache._insert(key, item, tag)
+        return
+    if hasattr(cache, "t1"):
+        getattr(cache, tag)[key] = None
+        if item is None:
+            return  # Ghost key
+    else:
+        order = next((getattr(cache, name) for name in _ORDERS
+                      if hasattr(cache, name)), None)
+        if order is not None:
+            order[key] = None
+    cache.cache_data[key] = item
+
+
+def save_snapshot(cache, path):
+    """
+    Write the items of a cache and its eviction state to a file.
+
+    Records are pickled one at a time, so the snapshot is never built
+    in memory. The file is replaced atomically.
+    Args:
+        cache: The cache policy instance to save.
+        path: Path of the snapshot file.
+    Returns:
+        The number of records written.
+    """
+    header = {
+        "format": SNAPSHOT_FORMAT,
+        "version": SNAPSHOT_VERSION,
+        "policy": type(cache).__name__,
+        "state": {name: getattr(cache, name) for name in _SCALARS
+                  if hasattr(cache, name)},
+    }
+    tmp_path = f"{path}.tmp"
+    count = 0
+    with open(tmp_path, "wb") as f:
+        pickle.dump(header, f, pickle.HIGHEST_PROTOCOL)
+        for record in _records(cache):
+            pickle.dump(record, f, pickle.HIGHEST_PROTOCOL)
+            count += 1
+        pickle.dump(None, f, pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    return count
+
+
+def load_snapshot(cache, path):
+    """
+    Restore a snapshot written by save_snapshot() into an empty cache
+    of the same policy, record by record.
+
+    If the snapshot holds more items than the cache may keep now, the
+    extra items are evicted under the policy. Snapshots are pickles:
+    only load files this process or a trusted one wrote.
+    Args:
+        cache: An empty instance of the policy that was saved.
+        path: Path of the snapshot file.
+    Returns:
+        The number of records read.
+    """
+    if cache.cache_data:
+        raise ValueError("snapshots can only be loaded into an empty cache")
+
+    count = 0
+    with open(path, "rb") as f:
+        header = pickle.load(f)
+        if (not isinstance(header, dict) or
+                header.get("format") != SNAPSHOT_FORMAT):
+            raise ValueError(f"{path} is not a cache snapshot")
+        if header["version"] != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"unsupported snapshot version {header['version']}")
+        if header["policy"] != type(cache).__name__:
+            raise ValueError(f"snapshot of a {header['policy']} cannot be "
+                             f"loaded into a {type(cache).__name__}")
+
+        for name, value in header["state"].items():
+            setattr(cache, name, value)
+        while True:
+            record = pickle.load(f)
+            if record is None:
+                break
+            _restore(cache, *record)
+            count += 1
+
+    if hasattr(cache, "_evict"):
+        capacity = getattr(cache, "max_items", BaseCaching.MAX_ITEMS)
+        while len(cache.cache_data) > capacity:
+            cache._evict()
+    return count
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+""" 111-main """
+import os
+import random
+import tempfile
+
+snapshot = __import__('111-cache_snapshot')
+POLICIES = (
+    __import__('1-fifo_cache').FIFOCache,
+    __import__('2-lifo_cache').LIFOCache,
+    __import__('3-lru_cache').LRUCache,
+    __import__('4-mru_cache').MRUCache,
+    __import__('100-lfu_cache').LFUCache,
+    __import__('105-arc_cache').ARCCache,
+)
+
+path = os.path.join(tempfile.mkdtemp(), "cache.snapshot")
+
+# A restored cache must evict exactly like the one it was saved from
+for policy in POLICIES:
+    rnd = random.Random(3)
+    original = policy(50)
+    original.on_evict = lambda key, item: None
+    for i in range(3000):
+        key = int(rnd.paretovariate(0.7)) % 200
+        if rnd.random() < 0.5:
+            original.put(key, i)
+        else:
+            original.get(key)
+
+    print("{}: saved {} records".format(
+        policy.__name__, snapshot.save_snapshot(original, path)))
+    restored = policy(50)
+    snapshot.load_snapshot(restored, path)
+
+    evicted, restored_evicted = [], []
+    original.on_evict = lambda key, item: evicted.append(key)
+    restored.on_evict = lambda key, item: restored_evicted.append(key)
+    same = True
+    for i in range(3000):
+        key = rnd.randrange(300)
+        if rnd.random() < 0.5:
+            original.put(key, i)
+            restored.put(key, i)
+        elif original.get(key) != restored.get(key):
+            same = False
+    same = (same and evicted == restored_evicted and
+            original.cache_data == restored.cache_data)
+    print("{}: same evictions after a restore: {}".format(
+        policy.__name__, same))
+
+# A smaller cache evicts the extra items under its policy
+small = POLICIES[-1](10)
+small.on_evict = lambda key, item: None
+snapshot.load_snapshot(small, path)
+print("Restored into 10 items: {}".format(len(small.cache_data)))
+
+os.remove(path)
+os.rmdir(os.path.dirname(path))
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+""" 112-main """
+tiered_cache = __import__('112-tiered_cache')
+LRUCache = __import__('3-lru_cache').LRUCache
+
+
+class RacingStore(tiered_cache.LocalStore):
+    """ LocalStore that runs a hook right after a read, once """
+
+    def __init__(self):
+        """ Initialize the class """
+        super().__init__()
+        self.after_get = None
+
+    def get(self, key):
+        """ Value of a key, then run and clear the hook """
+        value = super().get(key)
+        hook, self.after_get = self.after_get, None
+        if hook is not None:
+            hook()
+        return value
+
+
+store = RacingStore()
+a = tiered_cache.TieredCache(LRUCache, store)
+b = tiered_cache.TieredCache(LRUCache, store)
+
+b.put("k", "v1")
+print(a.get("k"), b.get("k"))
+b.put("k", "v2")
+print(a.get("k"), b.get("k"))
+
+# Worker b writes while worker a is between its L2 read and its L1 fill
+b.put("race", "v1")
+store.after_get = lambda: b.put("race", "v2")
+print(a.get("race"))
+print(a.get("race"), store.get("race"))
+print("L1 of a is stale: {}".format(a.cache_data.get("race") == "v1"))
+
+# A read-through load racing with an invalidation is not cached either
+loaded = tiered_cache.TieredCache(LRUCache, store, loader=lambda key: "v0")
+store.after_get = lambda: b.invalidate("late")
+print(loaded.get("late"), "late" in loaded.cache_data)
+print(loaded.get("late"), "late" in loaded.cache_data)
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+""" Two-tier cache module: in-process policy in front of a shared store """
+
+import pickle
+import threading
+import uuid
+
+from base_caching import BaseCaching
+
+
+class LocalStore:
+    """
+    LocalStore class, an in-process stand-in for a shared store such as
+    Redis. Tiered caches of several simulated workers can share one.
+    """
+
+    def __init__(self):
+        """ Initialize the class """
+        self.data = {}
+        self.subscribers = []
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """ Value of a key, None if missing """
+        with self.lock:
+            return self.data.get(key)
+
+    def set(self, key, value):
+        """ Store a value """
+        with self.lock:
+            self.data[key] = value
+
+    def delete(self, key):
+        """ Remove a key if present """
+        with self.lock:
+            self.data.pop(key, None)
+
+    def publish(self, message):
+        """ Deliver a message to every subscriber """
+        with self.lock:
+            subscribers = list(self.subscribers)
+        for callback in subscribers:
+            callback(message)
+
+    def subscribe(self, callback):
+        """ Call `callback(message)` for every published message """
+        with self.lock:
+            self.subscribers.append(callback)
+
+
+class RedisStore:
+    """
+    RedisStore class, a shared store on a Redis-protocol server. Keys
+    and values are pickled, and invalidations go through pub/sub.
+    Needs the `redis` package.
+    """
+
+    def __init__(self, client=None, prefix="cache:",
+                 channel="cache-invalidation", **redis_kwargs):
+        """
+        Initialize the class.
+        Args:
+            client: A redis.Redis client, created from redis_kwargs if None.
+            prefix: Prefix of the Redis keys of this cache.
+            channel: Pub/sub channel for invalidations.
+        """
+        if client is None:
+            import redis
+            client = redis.Redis(**redis_kwargs)
+        self.client = client
+        self.prefix = prefix.encode()
+        self.channel = channel
+        self.listener = None
+
+    def _key(self, key):
+        """ Redis key of a cache key """
+        return self.prefix + pickle.dumps(key)
+
+    def get(self, key):
+        """ Value of a key, None if missing """
+        raw = self.client.get(self._key(key))
+        return None if raw is None else pickle.loads(raw)
+
+    def set(self, key, value):
+        """ Store a value """
+        self.client.set(self._key(key), pickle.dumps(value))
+
+    def delete(self, key):
+        """ Remove a key if present """
+        self.client.delete(self._key(key))
+
+    def publish(self, message):
+        """ Deliver a message to every subscriber """
+        self.client.publish(self.channel, pickle.dumps(message))
+
+    def subscribe(self, callback):
+        """ Call `callback(message)` for every published message """
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(**{
+            self.channel: lambda raw: callback(pickle.loads(raw["data"]))
+        })
+        self.listener = pubsub.run_in_thread(sleep_time=0.01, daemon=True)
+
+
+class TieredCache(BaseCaching):
+    """
+    TieredCache class that keeps an in-process cache policy (L1) in
+    front of a store shared by every worker (L2).
+
+    Reads go to L1, then to L2, then to the optional loader, and
+    results fill the tiers they missed. Writes go to L1 and to L2
+    either at once (write-through) or from a background thread that
+    coalesces them (write-behind). Every write to L2 is published so
+    the other workers drop their stale L1 copy.
+    """
+
+    def __init__(self, cache_class, store, write_mode="through",
+                 loader=None, flush_interval=0.05):
+        """
+        Initialize the class.
+        Args:
+            cache_class: BaseCaching subclass (or factory) for L1.
+            store: Shared L2 store, such as LocalStore or RedisStore.
+            write_mode: "through" or "behind".
+            loader: Callable loading a missing key from the source of
+                truth (read-through), or None.
+            flush_interval: Seconds between write-behind flushes.
+        """
+        if write_mode not in ("through", "behind"):
+            raise ValueError("write_mode must be 'through' or 'behind'")
+        self.l1 = cache_class()
+        self.store = store
+        self.write_mode = write_mode
+        self.loader = loader
+        self.id = uuid.uuid4().hex
+        self.lock = threading.RLock()
+        # Keys being read from L2 -> (readers, invalidations since)
+        self.reading = {}
+        self.store.subscribe(self._on_message)
+
+        self.pending = {}  # Write-behind: key -> latest item
+        self.flush_interval = flush_interval
+        self.stopping = threading.Event()
+        self.flusher = None
+        if write_mode == "behind":
+            self.flusher = threading.Thread(target=self._flush_loop,
+                                            daemon=True)
+            self.flusher.start()
+
+    @property
+    def cache_data(self):
+        """ Items of L1 """
+        return self.l1.cache_data
+
+    def _on_message(self, message):
+        """ Drop the L1 copy of a key another worker wrote """
+        origin, key = message
+        if origin == self.id:
+            return
+        with self.lock:
+            self._invalidated(key)
+            if key in self.cache_data:
+                self.l1._discard(key)
+
+    def _invalidated(self, key):
+        """ Tell the reads of a key in flight that L2 changed """
+        if key in self.reading:
+            readers, invalidations = self.reading[key]
+            self.reading[key] = (readers, invalidations + 1)
+
+    def _write(self, key, item):
+        """ Write a key to L2 and tell the other workers """
+        if item is None:
+            self.store.delete(key)
+        else:
+            self.store.set(key, item)
+        self.store.publish((self.id, key))
+
+    def _flush_loop(self):
+        """ Flush write-behind items until close() is called """
+        while not self.stopping.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self):
+        """ Write every pending write-behind item to L2 now """
+        with self.lock:
+            pending, self.pending = self.pending, {}
+        for key, item in pending.items():
+            self._write(key, item)
+
+    def close(self):
+        """ Flush pending writes and stop the write-behind thread """
+        if self.flusher is not None:
+            self.stopping.set()
+            self.flusher.join()
+            self.flusher = None
+        self.flush()
+
+    def put(self, key, item):
+        """ Add an item to both tiers """
+        if key is None or item is None:
+            return
+        with self.lock:
+            self._invalidated(key)
+            self.l1.put(key, item)
+            if self.write_mode == "behind":
+                self.pending[key] = item
+                return
+        self._write(key, item)
+
+    def get(self, key):
+        """ Get an item from L1, L2 or the loader """
+        if key is None:
+            return None
+        with self.lock:
+            item = self.l1.get(key)
+            if item is None:
+                item = self.pending.get(key)
+            if item is not None:
+                return item
+            readers, invalidations = self.reading.get(key, (0, 0))
+            self.reading[key] = (readers + 1, invalidations)
+
+        try:
+            item = self.store.get(key)
+            if item is None and self.loader is not None:
+                item = self.loader(key)
+                if item is not None:
+                    self.store.set(key, item)
+        finally:
+            with self.lock:
+                readers, now = self.reading.pop(key)
+                if readers > 1:
+                    self.reading[key] = (readers - 1, now)
+                # A write or invalidation since the L2 read may have
+                # made the item stale: only fill L1 if none came
+                if now == invalidations and item is not None:
+                    self.l1.put(key, item)
+        return item
+
+    def invalidate(self, key):
+        """ Remove a key from both tiers and from every worker's L1 """
+        with self.lock:
+            self._invalidated(key)
+            if key in self.cache_data:
+                self.l1._discard(key)
+            self.pending.pop(key, None)
+        self._write(key, None)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+""" 113-main """
+import multiprocessing
+import random
+
+SharedMemoryCache = __import__('113-shared_memory_cache').SharedMemoryCache
+POLICIES = {
+    "lru": __import__('3-lru_cache').LRUCache,
+    "fifo": __import__('1-fifo_cache').FIFOCache,
+}
+
+my_cache = SharedMemoryCache(max_items=4)
+my_cache.put("A", "Hello")
+my_cache.put("B", "World")
+my_cache.put("C", "Holberton")
+my_cache.put("D", "School")
+my_cache.print_cache()
+print(my_cache.get("B"))
+my_cache.put("E", "Battery")
+my_cache.print_cache()
+
+# Attach by name, as another process would, with the creator's lock
+attached = SharedMemoryCache(name=my_cache.name, create=False,
+                             lock=my_cache.lock)
+print(attached.get("E"))
+attached.close()
+
+
+def worker(cache, start):
+    """ Put keys from a forked process """
+    for key in range(start, start + 3):
+        cache.put(key, key * 10)
+
+
+shared = SharedMemoryCache(max_items=100)
+context = multiprocessing.get_context("fork")
+workers = [context.Process(target=worker, args=(shared, start))
+           for start in (0, 10, 20)]
+for process in workers:
+    process.start()
+for process in workers:
+    process.join()
+print(sorted(shared.cache_data.items()))
+shared.close()
+shared.unlink()
+
+# Random puts and gets must evict like the in-process policies
+for policy, cache_class in POLICIES.items():
+    same = True
+    for seed in range(10):
+        rnd = random.Random(seed)
+        max_items = rnd.choice((1, 4, 32))
+        cache = SharedMemoryCache(max_items=max_items, policy=policy)
+        reference = cache_class(max_items)
+        evicted, reference_evicted = [], []
+        cache.on_evict = lambda key, item: evicted.append(key)
+        reference.on_evict = lambda key, item: reference_evicted.append(key)
+        for i in range(2000):
+            key = int(rnd.paretovariate(1.1)) % 60
+            if rnd.random() < 0.5:
+                cache.put(key, i)
+                reference.put(key, i)
+            elif cache.get(key) != reference.get(key):
+                same = False
+        same = (same and evicted == reference_evicted and
+                cache.cache_data == reference.cache_data)
+        cache.close()
+        cache.unlink()
+    print("{}: same evictions as {}: {}".format(
+        policy, cache_class.__name__, same))
+
+my_cache.close()
+my_cache.unlink()
@@ -0,0 +1,363 @@
+#!/usr/bin/env python3
+""" Shared-memory cache module """
+
+import hashlib
+import multiprocessing
+import pickle
+import struct
+from multiprocessing import shared_memory
+
+from base_caching import BaseCaching
+from capacity import EvictionMixin, check_max_items
+
+MAGIC = b"ALXSHMC1"
+POLICIES = ("lru", "fifo")
+# magic, slots, slot size, capacity, count, head, tail, policy
+HEADER = struct.Struct("<8sIIIIiiB3x")
+# state, key hash, prev, next, key length, value length
+SLOT = struct.Struct("<B3xqiiII")
+EMPTY, USED = 0, 1
+NIL = -1
+
+
+def _hash(key_bytes):
+    """ Hash of a pickled key that is the same in every process """
+    digest = hashlib.blake2b(key_bytes, digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+class SharedMemoryCache(EvictionMixin, BaseCaching):
+    """
+    SharedMemoryCache class that keeps its items in a fixed-size
+    multiprocessing.shared_memory segment, so pre-forked workers share
+    one cache without sending items over sockets.
+
+    The segment is a header followed by fixed-size slots. Slots form
+    an open-addressing hash table, with linear probing and
+    backward-shift deletion, and a doubly linked list from the newest
+    (head) to the oldest (tail) item. The tail is evicted first. With
+    the "lru" policy a get moves an item to the head; with "fifo" it
+    does not. Keys and items are pickled into their slot, and items too
+    large for a slot are not cached.
+
+    Every operation holds a lock shared by all the processes. The
+    default multiprocessing.Lock works for workers forked after the
+    cache is created; processes attaching by name must pass the lock
+    of the creating process, as a lock of their own would not exclude
+    it.
+    """
+
+    def __init__(self, name=None, create=True, slots=None, slot_size=256,
+                 policy="lru", lock=None, max_items=None):
+        """
+        Initialize the class.
+        Args:
+            name: Name of the segment, generated if None on creation.
+            create: Whether to create the segment or attach to it.
+            slots: Number of slots, about 4/3 of max_items if None.
+            slot_size: Bytes per slot, header included.
+            policy: "lru" or "fifo", ignored when attaching.
+            lock: Lock shared by every process using the segment;
+                required when attaching.
+            max_items: Capacity, BaseCaching.MAX_ITEMS if None, and at
+                most slots - 1; ignored when attaching.
+        Raises:
+            ValueError: If attaching without a lock.
+        """
+        if not create and lock is None:
+            raise ValueError("attaching to a segment requires its lock")
+        self.lock = lock if lock is not None else multiprocessing.Lock()
+        if not create:
+            self.shm = shared_memory.SharedMemory(name=name)
+            (magic, self.slots, self.slot_size,
+             _, _, _, _, policy_id) = HEADER.unpack_from(self.shm.buf, 0)
+            if magic != MAGIC:
+                raise ValueError(f"{name} is not a shared-memory cache")
+            self.policy = POLICIES[policy_id]
+            return
+
+        if policy not in POLICIES:
+            raise ValueError(f"policy must be one of {POLICIES}")
+        if slot_size <= SLOT.size:
+            raise ValueError(f"slot_size must exceed {SLOT.size} bytes")
+        max_items = check_max_items(max_items)
+        if slots is None:
+            slots = max_items * 4 // 3 + 1
+        # At least one slot always stays empty to end the probes
+        self.slots = max(slots, 2)
+        self.slot_size = slot_size
+        capacity = min(max_items, self.slots - 1)
+        self.policy = policy
+        size = HEADER.size + self.slots * slot_size
+        self.shm = shared_memory.SharedMemory(name=name, create=True,
+                                              size=size)
+        HEADER.pack_into(self.shm.buf, 0, MAGIC, self.slots, slot_size,
+                         capacity, 0, NIL, NIL, POLICIES.index(policy))
+
+    @property
+    def name(self):
+        """ Name other processes attach with """
+        return self.shm.name
+
+    @property
+    def max_items(self):
+        """ Capacity, kept in the header so resizes reach every process """
+        return struct.unpack_from("<I", self.shm.buf, 16)[0]
+
+    @property
+    def cache_data(self):
+        """ Snapshot of the items in the segment """
+        with self.lock:
+            data = {}
+            for i in range(self.slots):
+                state, _, _, _, key_len, value_len = self._slot(i)
+                if state == USED:
+                    key, item = self._payload(i, key_len, value_len)
+                    data[key] = item
+            return data
+
+    # Segment layout helpers
+
+    def _offset(self, i):
+        """ Offset of slot i in the segment """
+        return HEADER.size + i * self.slot_size
+
+    def _header(self):
+        """ count, head and tail from the segment header """
+        return HEADER.unpack_from(self.shm.buf, 0)[4:7]
+
+    def _set_header(self, count, head, tail):
+        """ Write count, head and tail to the segment header """
+        struct.pack_into("<Iii", self.shm.buf, 20, count, head, tail)
+
+    def _slot(self, i):
+        """ Header fields of slot i """
+        return SLOT.unpack_from(self.shm.buf, self._offset(i))
+
+    def _set_links(self, i, prev, next_):
+        """ Set the list neighbours of slot i """
+        struct.pack_into("<ii", self.shm.buf, self._offset(i) + 12,
+                         prev, next_)
+
+    def _payload(self, i, key_len, value_len):
+        """ Unpickled key and item of slot i """
+        start = self._offset(i) + SLOT.size
+        buf = self.shm.buf
+        return (pickle.loads(buf[start:start + key_len]),
+                pickle.loads(buf[start + key_len:start + key_len + value_len]))
+
+    def _find(self, key_bytes, h):
+        """ Slot of a key, or the empty slot ending its probe, and a flag """
+        buf = self.shm.buf
+        i = h % self.slots
+        while True:
+            state, slot_hash, _, _, key_len, _ = self._slot(i)
+            if state == EMPTY:
+                return i, False
+            if slot_hash == h and key_len == len(key_bytes):
+                start = self._offset(i) + SLOT.size
+                if buf[start:start + key_len] == key_bytes:
+                    return i, True
+            i = (i + 1) % self.slots
+
+    # Recency list
+
+    def _unlink(self, i):
+        """ Take slot i out of the list """
+        count, head, tail = self._header()
+        _, _, prev, next_, _, _ = self._slot(i)
+        if prev == NIL:
+            head = next_
+        else:
+            _, _, p_prev, _, _, _ = self._slot(prev)
+            self._set_links(prev, p_prev, next_)
+        if next_ == NIL:
+            tail = prev
+        else:
+            _, _, _, n_next, _, _ = self._slot(next_)
+            self._set_links(next_, prev, n_next)
+        self._set_header(count, head, tail)
+
+    def _push_head(self, i):
+        """ Put slot i at the newest end of the list """
+        count, head, tail = self._header()
+        self._set_links(i, NIL, head)
+        if head == NIL:
+            tail = i
+        else:
+            _, _, _, h_next, _, _ = self._slot(head)
+            self._set_links(head, i, h_next)
+        self._set_header(count, i, tail)
+
+    # Table maintenance
+
+    def _move(self, src, dst):
+        """ Move the item of slot src into the empty slot dst """
+        buf = self.shm.buf
+        start = self._offset(src)
+        buf[self._offset(dst):self._offset(dst) + self.slot_size] = \
+            buf[start:start + self.slot_size]
+        buf[start] = EMPTY
+        count, head, tail = self._header()
+        _, _, prev, next_, _, _ = self._slot(dst)
+        if prev == NIL:
+            head = dst
+        else:
+            _, _, p_prev, _, _, _ = self._slot(prev)
+            self._set_links(prev, p_prev, dst)
+        if next_ == NIL:
+            tail = dst
+        else:
+            _, _, _, n_next, _, _ = self._slot(next_)
+            self._set_links(next_, dst, n_next)
+        self._set_header(count, head, tail)
+
+    def _remove(self, i):
+        """ Free slot i and shift back the probe chain that follows it """
+        self._unlink(i)
+        count, head, tail = self._header()
+        self._set_header(count - 1, head, tail)
+        self.shm.buf[self._offset(i)] = EMPTY
+
+        hole = i
+        j = i
+        while True:
+            j = (j + 1) % self.slots
+            state, slot_hash, _, _, _, _ = self._slot(j)
+            if state == EMPTY:
+                return
+            home = slot_hash % self.slots
+            # Slot j stays if its home lies cyclically in (hole, j]
+            if hole <= j:
+                stays = hole < home <= j
+            else:
+                stays = home > hole or home <= j
+            if not stays:
+                self._move(j, hole)
+                hole = j
+
+    def _victim_slot(self):
+        """ Slot that the next eviction would discard """
+        return self._header()[2]
+
+    def _evict_locked(self):
+        """ Discard the oldest item, with the lock held """
+        i = self._victim_slot()
+        _, _, _, _, key_len, value_len = self._slot(i)
+        key, item = self._payload(i, key_len, value_len)
+        self._remove(i)
+        return key, item
+
+    def _victim(self):
+        """ Key that the next eviction would discard """
+        with self.lock:
+            i = self._victim_slot()
+            _, _, _, _, key_len, value_len = self._slot(i)
+            return self._payload(i, key_len, value_len)[0]
+
+    def _evict(self):
+        """ Discard one item under the policy and return its key """
+        with self.lock:
+            key, item = self._evict_locked()
+        self.on_evict(key, item)
+        return key
+
+    def _discard(self, key):
+        """ Remove a key from the cache without counting it as evicted """
+        key_bytes = pickle.dumps(key)
+        with self.lock:
+            i, found = self._find(key_bytes, _hash(key_bytes))
+            if not found:
+                raise KeyError(key)
+            self._remove(i)
+
+    def put(self, key, item):
+        """ Add an item to the cache """
+        if key is None or item is None:
+            return
+
+        key_bytes = pickle.dumps(key)
+        value_bytes = pickle.dumps(item)
+        h = _hash(key_bytes)
+        fits = (SLOT.size + len(key_bytes) + len(value_bytes) <=
+                self.slot_size)
+        evicted = None
+        with self.lock:
+            i, found = self._find(key_bytes, h)
+            if not fits:
+                # Too large to cache: drop any older value
+                if found:
+                    self._remove(i)
+                return
+
+            if found:
+                _, _, prev, next_, _, _ = self._slot(i)
+                if self.policy == "lru":
+                    self._unlink(i)
+            else:
+                if self._header()[0] >= self.max_items:
+                    evicted = self._evict_locked()
+                    i, _ = self._find(key_bytes, h)
+                count, head, tail = self._header()
+                self._set_header(count + 1, head, tail)
+                prev = next_ = NIL
+
+            start = self._offset(i)
+            SLOT.pack_into(self.shm.buf, start, USED, h, prev, next_,
+                           len(key_bytes), len(value_bytes))
+            payload = start + SLOT.size
+            self.shm.buf[payload:payload + len(key_bytes)] = key_bytes
+            payload += len(key_bytes)
+            self.shm.buf[payload:payload + len(value_bytes)] = value_bytes
+            if not found or self.policy == "lru":
+                self._push_head(i)
+        if evicted is not None:
+            self.on_evict(*evicted)
+
+    def get(self, key):
+        """ Get an item from the cache """
+        if key is None:
+            return None
+
+        key_bytes = pickle.dumps(key)
+        with self.lock:
+            i, found = self._find(key_bytes, _hash(key_bytes))
+            if not found:
+                return None
+            _, _, _, _, key_len, value_len = self._slot(i)
+            if self.policy == "lru":
+                self._unlink(i)
+                self._push_head(i)
+            start = self._offset(i) + SLOT.size + key_len
+            return pickle.loads(self.shm.buf[start:start + value_len])
+
+    def resize(self, max_items, batch=64):
+        """
+        Change the capacity of the segment for every process using it,
+        evicting the oldest items as needed. The number of slots is
+        fixed, so the capacity is at most slots - 1.
+        Args:
+            max_items: New capacity, at least 1.
+            batch: Maximum number of items this call evicts.
+        Returns:
+            The number of items still over capacity; call again with
+            the same capacity until it returns 0.
+        """
+        max_items = min(check_max_items(max_items), self.slots - 1)
+        evicted = []
+        with self.lock:
+            struct.pack_into("<I", self.shm.buf, 16, max_items)
+            for _ in range(min(batch, self._header()[0] - max_items)):
+                evicted.append(self._evict_locked())
+            over = max(0, self._header()[0] - max_items)
+        for key, item in evicted:
+            self.on_evict(key, item)
+        return over
+
+    def close(self):
+        """ Detach this process from the segment """
+        self.shm.close()
+
+    def unlink(self):
+        """ Destroy the segment, once every process has closed it """
+        self.shm.unlink()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+""" Memory benchmark: bytes per entry kept by each cache policy """
+
+import gc
+import tracemalloc
+
+from base_caching import BaseCaching
+
+POLICIES = (
+    __import__('0-basic_cache').BasicCache,
+    __import__('1-fifo_cache').FIFOCache,
+    __import__('2-lifo_cache').LIFOCache,
+    __import__('3-lru_cache').LRUCache,
+    __import__('4-mru_cache').MRUCache,
+    __import__('100-lfu_cache').LFUCache,
+    __import__('105-arc_cache').ARCCache,
+)
+ENTRIES = 200_000
+
+
+def bytes_per_entry(policy, entries=ENTRIES) -> float:
+    """
+    Fill a cache with `entries` keys that share one item, then touch
+    every other key once so policies with frequencies have two levels.
+
+    Returns:
+        float: Bytes allocated by the cache per entry, keys excluded.
+    """
+    keys = list(range(entries))
+    item = object()
+    gc.collect()
+    tracemalloc.start()
+    cache = policy()
+    for key in keys:
+        cache.put(key, item)
+    for key in keys[::2]:
+        cache.get(key)
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del cache
+    return used / entries
+
+
+if __name__ == "__main__":
+    BaseCaching.MAX_ITEMS = ENTRIES
+    basic = None
+    print(f"{'policy':<12}{'bytes/entry':>12}{'over dict':>12}")
+    for policy in POLICIES:
+        size = bytes_per_entry(policy)
+        if basic is None:
+            basic = size
+        print(f"{policy.__name__:<12}{size:>12.1f}{size - basic:>12.1f}")
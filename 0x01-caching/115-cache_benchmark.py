@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Trace-replay benchmark of the cache policies: hit ratio, ops/sec and
+peak memory per policy, trace and capacity.
+
+Usage:
+    ./115-cache_benchmark.py [--capacity N ...] [--length N]
+                             [--trace FILE ...] [--repeat N]
+                             [--json FILE] [--hash-seed N]
+                             [--baseline FILE] [--tolerance RATIO]
+
+A recorded trace is a text file with one access per line; its first
+field is the key, and blank lines and lines starting with '#' are
+skipped. With --baseline, results are compared to a previous --json
+output and the exit status is 1 if any of them regressed.
+
+str hashes change with PYTHONHASHSEED, and TinyLFU's sketch with
+them, so the benchmark re-runs itself under a fixed seed; hit ratios
+are only held exactly to a baseline measured with the same seed.
+"""
+
+import argparse
+import bisect
+import itertools
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+TinyLFUCache = __import__('106-tinylfu_cache').TinyLFUCache
+LRUCache = __import__('3-lru_cache').LRUCache
+
+POLICIES = {
+    "FIFO": __import__('1-fifo_cache').FIFOCache,
+    "LIFO": __import__('2-lifo_cache').LIFOCache,
+    "LRU": LRUCache,
+    "MRU": __import__('4-mru_cache').MRUCache,
+    "LFU": __import__('100-lfu_cache').LFUCache,
+    "ARC": __import__('105-arc_cache').ARCCache,
+    "TinyLFU": lambda max_items: TinyLFUCache(LRUCache,
+                                              max_items=max_items),
+}
+CAPACITIES = (100, 1_000, 10_000)
+LENGTH = 200_000
+REPEAT = 3
+HASH_SEED = 0
+
+
+def zipf_trace(length=LENGTH, keys=50_000, alpha=0.9, seed=0):
+    """ Keys drawn with probability proportional to 1 / rank**alpha """
+    weights = itertools.accumulate(1 / rank ** alpha
+                                   for rank in range(1, keys + 1))
+    cumulative = list(weights)
+    total = cumulative[-1]
+    rnd = random.Random(seed)
+    return [bisect.bisect(cumulative, rnd.random() * total)
+            for _ in range(length)]
+
+
+def scan_trace(length=LENGTH, hot=500, scan=5_000, every=10_000, seed=1):
+    """ Zipf hot set, interrupted by a scan of new keys every `every` """
+    hot_keys = zipf_trace(length, keys=hot, seed=seed)
+    trace = []
+    next_key = hot
+    for i, key in enumerate(hot_keys):
+        if i % every == 0:
+            trace.extend(range(next_key, next_key + scan))
+            next_key += scan
+        trace.append(key)
+    return trace[:length]
+
+
+def loop_trace(length=LENGTH, size=2_000):
+    """ The same `size` keys, read in order over and over """
+    return [i % size for i in range(length)]
+
+
+def file_trace(path, length=None):
+    """ Keys of a recorded access log, at most `length` of them """
+    trace = []
+    with open(path) as log:
+        for line in log:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            trace.append(line.split()[0])
+            if length is not None and len(trace) >= length:
+                break
+    return trace
+
+
+def replay(policy, trace, capacity):
+    """
+    Replay a trace as cache-aside lookups: get, then put on a miss.
+
+    Returns:
+        int: The number of hits.
+    """
+    cache = policy(capacity)
+    cache.on_evict = lambda key, item: None
+    get = cache.get
+    put = cache.put
+    hits = 0
+    for key in trace:
+        if get(key) is None:
+            put(key, key)
+        else:
+            hits += 1
+    return hits
+
+
+def measure(policy, trace, capacity, repeat=REPEAT):
+    """
+    Replay a trace `repeat` times timed, keeping the fastest, then once
+    under tracemalloc, which would otherwise slow the timed runs down.
+
+    Returns:
+        dict: hit_ratio, ops_per_sec and peak_bytes of the replay.
+    """
+    elapsed = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        hits = replay(policy, trace, capacity)
+        elapsed = min(elapsed, time.perf_counter() - start)
+
+    tracemalloc.start()
+    replay(policy, trace, capacity)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "hit_ratio": hits / len(trace),
+        "ops_per_sec": len(trace) / elapsed,
+        "peak_bytes": peak,
+    }
+
+
+def run(traces, capacities, policies=POLICIES, repeat=REPEAT):
+    """ Measure every policy on every trace at every capacity """
+    results = []
+    for trace_name, trace in traces.items():
+        for capacity in capacities:
+            for name, policy in policies.items():
+                result = {"policy": name, "trace": trace_name,
+                          "capacity": capacity}
+                result.update(measure(policy, trace, capacity, repeat))
+                results.append(result)
+    return results
+
+
+def regressions(results, baseline, tolerance, hash_seed=HASH_SEED):
+    """
+    Results worse than their baseline entry by more than `tolerance`,
+    a ratio: lower hit ratio or ops/sec, or higher peak memory.
+
+    Returns:
+        list: (result, metric, baseline value) tuples.
+    """
+    exact = baseline.get("hash_seed") == hash_seed
+    previous = {(r["policy"], r["trace"], r["capacity"]): r
+                for r in baseline["results"]}
+    found = []
+    for result in results:
+        old = previous.get(
+            (result["policy"], result["trace"], result["capacity"]))
+        if old is None:
+            continue
+        # Under the same hash seed hit ratios are deterministic, so any
+        # drop beyond noise counts
+        floor = (old["hit_ratio"] - 1e-9 if exact
+                 else old["hit_ratio"] * (1 - tolerance))
+        if result["hit_ratio"] < floor:
+            found.append((result, "hit_ratio", old["hit_ratio"]))
+        if result["ops_per_sec"] < old["ops_per_sec"] * (1 - tolerance):
+            found.append((result, "ops_per_sec", old["ops_per_sec"]))
+        if result["peak_bytes"] > old["peak_bytes"] * (1 + tolerance):
+            found.append((result, "peak_bytes", old["peak_bytes"]))
+    return found
+
+
+def main(argv=None):
+    """ Run the benchmark from the command line """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--capacity", type=int, action="append",
+                        help="cache capacity, repeatable")
+    parser.add_argument("--length", type=int, default=LENGTH,
+                        help="accesses per trace")
+    parser.add_argument("--trace", action="append", default=[],
+                        help="recorded access log, repeatable")
+    parser.add_argument("--repeat", type=int, default=REPEAT,
+                        help="timed replays, the fastest is kept")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--baseline", help="results to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed ops/sec and memory change ratio")
+    parser.add_argument("--hash-seed", type=int, default=HASH_SEED,
+                        help="PYTHONHASHSEED the benchmark runs under")
+    args = parser.parse_args(argv)
+    if os.environ.get("PYTHONHASHSEED") != str(args.hash_seed):
+        env = dict(os.environ, PYTHONHASHSEED=str(args.hash_seed))
+        command = [sys.executable, os.path.abspath(__file__)]
+        command += sys.argv[1:] if argv is None else argv
+        os.execve(sys.executable, command, env)
+
+    traces = {
+        "zipf": zipf_trace(args.length),
+        "scan": scan_trace(args.length),
+        "loop": loop_trace(args.length),
+    }
+    for path in args.trace:
+        traces[os.path.basename(path)] = file_trace(path, args.length)
+    results = run(traces, args.capacity or CAPACITIES,
+                  repeat=args.repeat)
+
+    print(f"{'trace':<12}{'capacity':>9}  {'policy':<8}"
+          f"{'hit ratio':>10}{'ops/sec':>12}{'peak KiB':>11}")
+    for r in results:
+        print(f"{r['trace']:<12}{r['capacity']:>9}  {r['policy']:<8}"
+              f"{r['hit_ratio']:>10.2%}{r['ops_per_sec']:>12,.0f}"
+              f"{r['peak_bytes'] / 1024:>11,.0f}")
+
+    report = {
+        "python": platform.python_version(),
+        "length": args.length,
+        "repeat": args.repeat,
+        "hash_seed": args.hash_seed,
+        "results": results,
+    }
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        found = regressions(results, baseline, args.tolerance,
+                            args.hash_seed)
+        for result, metric, old in found:
+            print(f"REGRESSION: {result['policy']} on {result['trace']} "
+                  f"at {result['capacity']}: {metric} "
+                  f"{result[metric]:.4g} (was {old:.4g})")
+        return 1 if found else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
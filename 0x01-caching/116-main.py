@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+""" 116-main """
+import time
+
+RefreshCache = __import__('116-refresh_cache').RefreshCache
+LRUCache = __import__('3-lru_cache').LRUCache
+StripedCache = __import__('101-concurrent_cache').StripedCache
+TinyLFUCache = __import__('106-tinylfu_cache').TinyLFUCache
+
+STORES = {
+    "LRUCache": LRUCache,
+    "StripedCache": lambda: StripedCache(LRUCache, 4, max_items=8),
+    "TinyLFUCache": lambda: TinyLFUCache(LRUCache, max_items=8),
+}
+
+now = [0]
+backend = {"a": "v1"}
+calls = []
+
+
+def loader(key):
+    """ Read a key from the backend, counting the calls """
+    calls.append(key)
+    return backend.get(key)
+
+
+def wait_refreshed(cache):
+    """ Wait for the background refreshes of a cache to finish """
+    while cache.loads:
+        time.sleep(0.001)
+
+
+for name, store in STORES.items():
+    now[0] = 0
+    backend["a"] = "v1"
+    del calls[:]
+    cache = RefreshCache(store, loader, ttl=10, stale_ttl=10,
+                         negative_ttl=5, clock=lambda: now[0])
+
+    # Negative caching: a missing key is asked for once per negative_ttl
+    results = [cache.get("missing"), cache.get("missing")]
+    now[0] = 6
+    results.append(cache.get("missing"))
+    print("{}: negative {} after {} loads".format(
+        name, results, calls.count("missing")))
+
+    # Stale-while-revalidate: the stale item is returned at once, then
+    # replaced by the background refresh
+    now[0] = 0
+    print("{}: {}, cached {}".format(name, cache.get("a"), cache.cache_data))
+    backend["a"] = "v2"
+    now[0] = 15
+    print("{}: stale {}".format(name, cache.get("a")))
+    wait_refreshed(cache)
+    print("{}: refreshed {}, {} loads".format(
+        name, cache.get("a"), calls.count("a")))
+    now[0] = 40
+    backend["a"] = "v3"
+    print("{}: expired, loaded {}".format(name, cache.get("a")))
+
+    # With negative_ttl=0, putting None drops the cached item
+    cache = RefreshCache(store, loader, negative_ttl=0,
+                         clock=lambda: now[0])
+    cache.put("a", "old")
+    cache.put("a", None)
+    print("{}: after put None {}, cached {}".format(
+        name, cache.get("a"), cache.cache_data))
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+""" Read-through cache with negative caching and stale-while-revalidate """
+
+import threading
+import time
+
+from base_caching import BaseCaching
+from capacity import EvictionMixin
+
+
+class _Load:
+    """ One in-flight load shared by the callers of a key """
+
+    def __init__(self):
+        """ Initialize the class """
+        self.done = threading.Event()
+        self.item = None
+        self.error = None
+
+
+class RefreshCache(EvictionMixin, BaseCaching):
+    """
+    RefreshCache class that loads missing keys through a loader and
+    keeps them in a cache policy with two deadlines.
+
+    Until `ttl` has passed an entry is fresh. For `stale_ttl` seconds
+    more it is stale: get() still returns it at once, and starts one
+    background refresh. Past that it has expired and get() loads the
+    key again, waiting for it.
+
+    A loader returning None means the key has no value. That result is
+    cached too, for `negative_ttl` seconds, so the backend is not asked
+    again on every lookup. The policy stores (item, fresh until, stale
+    until) entries, so a negative entry is not an ignored None item.
+    Concurrent loads and refreshes of one key run the loader once.
+    """
+
+    def __init__(self, cache_class, loader, ttl=60, stale_ttl=0,
+                 negative_ttl=5, clock=time.monotonic):
+        """
+        Initialize the class.
+        Args:
+            cache_class: BaseCaching subclass (or factory) for the store.
+            loader: Callable returning the item of a key, None if the
+                key has no value.
+            ttl: Seconds an item is fresh.
+            stale_ttl: Seconds after ttl an item is still returned
+                while it is refreshed in the background.
+            negative_ttl: Seconds a None result is cached, 0 to not
+                cache them.
+            clock: Callable returning the current time in seconds.
+        """
+        self.cache = cache_class()
+        self.cache.on_evict = self._evicted
+        self.loader = loader
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.negative_ttl = negative_ttl
+        self.clock = clock
+        self.lock = threading.RLock()
+        self.loads = {}  # key -> _Load in flight
+
+    @property
+    def entries(self):
+        """ Entries of the policy, negative ones included """
+        return self.cache.cache_data
+
+    @property
+    def cache_data(self):
+        """ Snapshot of the cached items, negative entries left out """
+        with self.lock:
+            return {key: entry[0] for key, entry in self.entries.items()
+                    if entry[0] is not None}
+
+    def _evicted(self, key, entry):
+        """ Pass an entry the policy evicted on to on_evict """
+        self.on_evict(key, entry[0])
+
+    def _victim(self):
+        """ Key that the next eviction would discard """
+        return self.cache._victim()
+
+    def _evict(self):
+        """ Discard one item under the policy and return its key """
+        with self.lock:
+            return self.cache._evict()
+
+    def _discard(self, key):
+        """ Remove a key from the cache without counting it as evicted """
+        with self.lock:
+            self.cache._discard(key)
+
+    def _store(self, key, item, ttl=None):
+        """ Cache an item, or a negative entry if item is None """
+        now = self.clock()
+        if item is None:
+            if not self.negative_ttl:
+                if key in self.entries:
+                    self.cache._discard(key)
+                return
+            fresh_until = stale_until = now + self.negative_ttl
+        else:
+            fresh_until = now + (self.ttl if ttl is None else ttl)
+            stale_until = fresh_until + self.stale_ttl
+        self.cache.put(key, (item, fresh_until, stale_until))
+
+    def _run_load(self, key, load):
+        """ Run the loader for a key and hand the result to its waiters """
+        try:
+            load.item = self.loader(key)
+            with self.lock:
+                self._store(key, load.item)
+        except BaseException as error:
+            load.error = error
+        finally:
+            with self.lock:
+                del self.loads[key]
+            load.done.set()
+
+    def _refresh(self, key):
+        """ Reload a stale key in the background, unless already loading """
+        if key in self.loads:
+            return
+        load = self.loads[key] = _Load()
+        threading.Thread(target=self._run_load, args=(key, load),
+                         daemon=True).start()
+
+    def put(self, key, item, ttl=None):
+        """
+        Add an item to the cache.
+        Args:
+            key: Key to store the item.
+            item: Item to store, None to cache that the key has no value.
+            ttl: Seconds the item is fresh, the cache ttl if None.
+        """
+        if key is None:
+            return
+        with self.lock:
+            self._store(key, item, ttl)
+
+    def get(self, key):
+        """ Get an item from the cache, loading it if missing or expired """
+        if key is None:
+            return None
+
+        with self.lock:
+            entry = self.cache.get(key)
+            if entry is not None:
+                item, fresh_until, stale_until = entry
+                now = self.clock()
+                if now < fresh_until:
+                    return item
+                if now < stale_until:
+                    self._refresh(key)
+                    return item
+                self.cache._discard(key)
+
+            load = self.loads.get(key)
+            leader = load is None
+            if leader:
+                load = self.loads[key] = _Load()
+        if leader:
+            self._run_load(key, load)
+        else:
+            load.done.wait()
+        if load.error is not None:
+            raise load.error
+        return load.item
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+""" Sharded cache module: consistent hashing over cache instances """
+
+import bisect
+import hashlib
+
+from base_caching import BaseCaching
+from capacity import EvictionMixin
+
+
+_MASK64 = (1 << 64) - 1
+_MIX = 0x9E3779B97F4A7C15  # Odd, so the mix is a bijection
+
+
+def _hash(text):
+    """ 64-bit position of a string on the ring, the same in every run """
+    digest = hashlib.blake2b(text.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def _position(key):
+    """
+    64-bit position of a key on the ring. It comes from hash(key), so
+    keys that are equal as dict keys, such as 1, 1.0 and True, share
+    it; the multiplication spreads consecutive integers over the ring.
+    """
+    return ((hash(key) & _MASK64) * _MIX) & _MASK64
+
+
+class ShardedCache(EvictionMixin, BaseCaching):
+    """
+    ShardedCache class that spreads keys over independent cache
+    instances (shards) with consistent hashing.
+
+    Every shard owns `vnodes` points of a hash ring, and a key belongs
+    to the shard of the first point at or after the key's hash. Adding
+    or removing a shard only moves the keys between its points and
+    their neighbours, about 1/N of them, and those keys are migrated
+    so no stale copy stays behind. Each shard applies its own policy
+    and capacity to its keys, so shards of different sizes can sit
+    side by side; they still get an equal share of the keys.
+    """
+
+    def __init__(self, cache_class, shards=4, vnodes=100, max_items=None):
+        """
+        Initialize the class.
+        Args:
+            cache_class: BaseCaching subclass (or factory taking the
+                capacity) for shards added without an instance.
+            shards: Number of shards to start with, named 0 to N - 1.
+            vnodes: Points per shard on the ring; more points spread
+                keys more evenly.
+            max_items: Capacity of each of the first shards,
+                BaseCaching.MAX_ITEMS if None.
+        """
+        if vnodes < 1:
+            raise ValueError("vnodes must be a positive integer")
+        self.cache_class = cache_class
+        self.vnodes = vnodes
+        self.shards = {}  # name -> cache instance
+        self.points = []  # sorted ring positions
+        self.owners = []  # shard name of each position
+        for name in range(shards):
+            self.add_shard(name, max_items=max_items)
+
+    @property
+    def cache_data(self):
+        """ Snapshot of the items of every shard """
+        data = {}
+        for shard in self.shards.values():
+            data.update(shard.cache_data)
+        return data
+
+    def _evicted(self, key, item):
+        """ Pass an eviction of any shard on to on_evict """
+        self.on_evict(key, item)
+
+    def _owner(self, key):
+        """ Name of the shard that owns a key """
+        if not self.points:
+            raise LookupError("the cache has no shards")
+        i = bisect.bisect_left(self.points, _position(key))
+        return self.owners[i % len(self.points)]
+
+    def shard(self, key):
+        """ Cache instance that owns a key """
+        return self.shards[self._owner(key)]
+
+    def add_shard(self, name, cache=None, max_items=None):
+        """
+        Add a shard and move to it the keys it now owns.
+        Args:
+            name: Name of the shard, used to place its points.
+            cache: Cache instance for the shard, a new cache_class()
+                if None.
+            max_items: Capacity of a new cache_class() shard.
+        """
+        if name in self.shards:
+            raise ValueError(f"shard {name!r} already exists")
+        if cache is None:
+            cache = self.cache_class(max_items)
+        cache.on_evict = self._evicted
+        # Only the shards owning the arcs the new points split lose keys
+        split = set()
+        for i in range(self.vnodes):
+            point = _hash(f"{name!r}#{i}")
+            at = bisect.bisect_left(self.points, point)
+            if self.points:
+                split.add(self.owners[at % len(self.points)])
+            self.points.insert(at, point)
+            self.owners.insert(at, name)
+        self.shards[name] = cache
+        split.discard(name)
+
+        for other in split:
+            shard = self.shards[other]
+            moved = [key for key in shard.cache_data
+                     if self._owner(key) == name]
+            for key in moved:
+                item = shard.cache_data[key]
+                shard._discard(key)
+                cache.put(key, item)
+
+    def remove_shard(self, name):
+        """
+        Remove a shard, moving its items to the shards that now own them.
+        Returns:
+            The cache instance of the removed shard, emptied.
+        """
+        cache = self.shards.pop(name)
+        kept = [(point, owner)
+                for point, owner in zip(self.points, self.owners)
+                if owner != name]
+        self.points = [point for point, _ in kept]
+        self.owners = [owner for _, owner in kept]
+
+        items = list(cache.cache_data.items())
+        for key, _ in items:
+            cache._discard(key)
+        if self.shards:
+            for key, item in items:
+                self.shard(key).put(key, item)
+        return cache
+
+    def _victim(self):
+        """ Key the next eviction would discard, from the largest shard """
+        return self._largest()._victim()
+
+    def _evict(self):
+        """ Discard one item from the largest shard and return its key """
+        return self._largest()._evict()
+
+    def _largest(self):
+        """ Shard holding the most items """
+        return max(self.shards.values(), key=lambda s: len(s.cache_data))
+
+    def _discard(self, key):
+        """ Remove a key from the cache without counting it as evicted """
+        self.shard(key)._discard(key)
+
+    def put(self, key, item):
+        """ Add an item to the cache """
+        if key is None or item is None:
+            return
+        self.shard(key).put(key, item)
+
+    def get(self, key):
+        """ Get an item from the cache """
+        if key is None:
+            return None
+        return self.shard(key).get(key)
+
+    def resize(self, max_items, batch=64):
+        """
+        Give every shard the same capacity, see the shards' resize().
+        Args:
+            max_items: New capacity of each shard, at least 1.
+            batch: Maximum number of items this call evicts.
+        Returns:
+            The number of items still over capacity; call again with
+            the same capacity until it returns 0.
+        """
+        over = 0
+        for shard in self.shards.values():
+            before = max(0, len(shard.cache_data) - max_items)
+            left = shard.resize(max_items, batch)
+            batch -= before - left
+            over += left
+        return over
@@ -2,31 +2,72 @@
 """ LIFO Cache Module """
 
 from base_caching import BaseCaching
+from capacity import CapacityMixin, EvictionMixin, check_max_items
 
 
-class LIFOCache(BaseCaching):
-    """ LIFOCache class that inherits from BaseCaching and LIFO cache """
+class LIFOCache(EvictionMixin, CapacityMixin, BaseCaching):
+    """
+    LIFOCache class that inherits from BaseCaching and LIFO cache
 
-    def __init__(self):
-        """ Initialize the class """
+    cache_data itself keeps the keys in put order, the last item added
+    at its end, so no other structure is needed.
+    """
+
+    def __init__(self, max_items=None):
+        """
+        Initialize the class.
+        Args:
+            max_items: Capacity of this cache, BaseCaching.MAX_ITEMS if
+                None.
+        """
         super().__init__()
-        self.last_key = None  # To keep track of the last item added
+        self.max_items = check_max_items(max_items)
+
+    def _victim(self):
+        """ Key that the next eviction would discard """
+        return next(reversed(self.cache_data))
+
+    def _evict(self):
+        """ Discard the last item put in cache and return its key """
+        last_key, item = self.cache_data.popitem()
+        self.on_evict(last_key, item)
+        return last_key
+
+    def _discard(self, key):
+        """ Remove a key from the cache without counting it as evicted """
+        del self.cache_data[key]
 
     def put(self, key, item):
         """ Add an item to the cache """
         if key is None or item is None:
             return
 
-        if len(self.cache_data) >= BaseCaching.MAX_ITEMS:
-            if self.last_key is not None:
-                # Discard the last item put in cache
-                print(f"DISCARD: {self.last_key}")
-                del self.cache_data[self.last_key]
+        if key in self.cache_data:
+            # Re-inserted below, so it becomes the last one put in cache
+            del self.cache_data[key]
+        elif len(self.cache_data) >= self.max_items:
+            # Discard the last item put in cache
+            self._evict()
 
-        # Add the item and update the last_key
         self.cache_data[key] = item
-        self.last_key = key
 
     def get(self, key):
         """ Get an item from the cache """
         return self.cache_data.get(key, None)
+
+    def get_many(self, keys):
+        """ Get several items from the cache, as a dict of the hits """
+        data = self.cache_data
+        return {key: data[key] for key in keys if key in data}
+
+    def put_many(self, mapping):
+        """ Add several items to the cache, evicting as put() would """
+        data = self.cache_data
+        for key, item in mapping.items():
+            if key is None or item is None:
+                continue
+            if key in data:
+                del data[key]
+            elif len(data) >= self.max_items:
+                self._evict()
+            data[key] = item
@@ -1,16 +1,42 @@
 #!/usr/bin/env python3
 """ LRU Cache Module """
 
+from collections import OrderedDict
+
 from base_caching import BaseCaching
+from capacity import CapacityMixin, EvictionMixin, check_max_items
 
 
-class LRUCache(BaseCaching):
+class LRUCache(EvictionMixin, CapacityMixin, BaseCaching):
     """ LRUCache class that inherits from BaseCaching LRU cache system """
 
-    def __init__(self):
-        """ Initialize the class """
+    def __init__(self, max_items=None):
+        """
+        Initialize the class.
+        Args:
+            max_items: Capacity of this cache, BaseCaching.MAX_ITEMS if
+                None.
+        """
         super().__init__()
-        self.order = []  # To keep track of the order of insertion and access
+        self.max_items = check_max_items(max_items)
+        # Keys from least to most recently used; OrderedDict keeps
+        # move_to_end and popitem(last=False) at O(1)
+        self.order = OrderedDict()
+
+    def _victim(self):
+        """ Key that the next eviction would discard """
+        return next(iter(self.order))
+
+    def _evict(self):
+        """ Discard the least recently used item and return its key """
+        lru_key, _ = self.order.popitem(last=False)
+        self.on_evict(lru_key, self.cache_data.pop(lru_key))
+        return lru_key
+
+    def _discard(self, key):
+        """ Remove a key from the cache without counting it as evicted """
+        del self.order[key]
+        del self.cache_data[key]
 
     def put(self, key, item):
         """ Add an item to the cache """
@@ -18,16 +44,15 @@ class LRUCache(BaseCaching):
             return
 
         if key in self.cache_data:
-            self.order.remove(key)
-        elif len(self.cache_data) >= BaseCaching.MAX_ITEMS:
-            # Discard the least recently used item
-            lru_key = self.order.pop(0)
-            del self.cache_data[lru_key]
-            print(f"DISCARD: {lru_key}")
-
-        # Add the item and update the order
+            self.order.move_to_end(key)
+        else:
+            if len(self.cache_data) >= self.max_items:
+                # Discard the least recently used item
+                self._evict()
+            self.order[key] = None
+
+        # Add the item
         self.cache_data[key] = item
-        self.order.append(key)
 
     def get(self, key):
         """ Get an item from the cache """
@@ -35,6 +60,31 @@ class LRUCache(BaseCaching):
             return None
 
         # Move the accessed key to the end to mark it as recently used
-        self.order.remove(key)
-        self.order.append(key)
+        self.order.move_to_end(key)
         return self.cache_data[key]
+
+    def get_many(self, keys):
+        """ Get several items from the cache, as a dict of the hits """
+        data = self.cache_data
+        touch = self.order.move_to_end
+        found = {}
+        for key in keys:
+            if key in data:
+                touch(key)
+                found[key] = data[key]
+        return found
+
+    def put_many(self, mapping):
+        """ Add several items to the cache, evicting as put() would """
+        data = self.cache_data
+        order = self.order
+        for key, item in mapping.items():
+            if key is None or item is None:
+                continue
+            if key in data:
+                order.move_to_end(key)
+            else:
+                if len(data) >= self.max_items:
+                    self._evict()
+                order[key] = None
+            data[key] = item
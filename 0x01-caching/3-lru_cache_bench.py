@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+""" Benchmark of LRUCache per-operation cost across cache sizes """
+
+import random
+import time
+
+from base_caching import BaseCaching
+
+LRUCache = __import__('3-lru_cache').LRUCache
+
+SIZES = (4, 100, 10_000, 100_000, 1_000_000)
+OPERATIONS = 200_000
+
+
+def bench(size: int, operations: int = OPERATIONS) -> float:
+    """
+    Fill an LRUCache of the given size, then time a mix of hits,
+    misses and evicting puts.
+
+    Returns:
+        float: The mean cost of one operation in nanoseconds.
+    """
+    BaseCaching.MAX_ITEMS = size
+    cache = LRUCache()
+    for i in range(size):
+        cache.put(i, i)
+
+    rnd = random.Random(size)
+    keys = [rnd.randrange(size * 2) for _ in range(operations)]
+
+    # Silence the DISCARD lines while timing
+    cache.on_evict = lambda key, item: None
+    start = time.perf_counter()
+    for i, key in enumerate(keys):
+        if i & 1:
+            cache.get(key)
+        else:
+            cache.put(key, i)
+    elapsed = time.perf_counter() - start
+    return elapsed / operations * 1e9
+
+
+if __name__ == "__main__":
+    for size in SIZES:
+        print(f"{size:>9} entries: {bench(size):8.1f} ns/op")
@@ -2,15 +2,40 @@
 """ MRU Cache Module """
 
 from base_caching import BaseCaching
+from capacity import CapacityMixin, EvictionMixin, check_max_items
 
 
-class MRUCache(BaseCaching):
-    """ MRUCache class that inherits from BaseCaching and cache system """
+class MRUCache(EvictionMixin, CapacityMixin, BaseCaching):
+    """
+    MRUCache class that inherits from BaseCaching and cache system
 
-    def __init__(self):
-        """ Initialize the class """
+    cache_data itself keeps the keys in order of use, the most recently
+    used at its end: a get moves its key there by re-inserting it.
+    """
+
+    def __init__(self, max_items=None):
+        """
+        Initialize the class.
+        Args:
+            max_items: Capacity of this cache, BaseCaching.MAX_ITEMS if
+                None.
+        """
         super().__init__()
-        self.order = []  # To keep track of the order of insertion and access
+        self.max_items = check_max_items(max_items)
+
+    def _victim(self):
+        """ Key that the next eviction would discard """
+        return next(reversed(self.cache_data))
+
+    def _evict(self):
+        """ Discard the most recently used item and return its key """
+        mru_key, item = self.cache_data.popitem()
+        self.on_evict(mru_key, item)
+        return mru_key
+
+    def _discard(self, key):
+        """ Remove a key from the cache without counting it as evicted """
+        del self.cache_data[key]
 
     def put(self, key, item):
         """ Add an item to the cache """
@@ -18,23 +43,43 @@ class MRUCache(BaseCaching):
             return
 
         if key in self.cache_data:
-            self.order.remove(key)
-        elif len(self.cache_data) >= BaseCaching.MAX_ITEMS:
+            del self.cache_data[key]
+        elif len(self.cache_data) >= self.max_items:
             # Discard the most recently used item
-            mru_key = self.order.pop()
-            del self.cache_data[mru_key]
-            print(f"DISCARD: {mru_key}")
+            self._evict()
 
-        # Add the item and update the order
+        # Add the item as the most recently used
         self.cache_data[key] = item
-        self.order.append(key)
 
     def get(self, key):
         """ Get an item from the cache """
         if key is None or key not in self.cache_data:
             return None
 
-        # Move the accessed key to the end to mark it as recently used
-        self.order.remove(key)
-        self.order.append(key)
-        return self.cache_data[key]
+        # Re-insert the accessed key to mark it as recently used
+        item = self.cache_data.pop(key)
+        self.cache_data[key] = item
+        return item
+
+    def get_many(self, keys):
+        """ Get several items from the cache, as a dict of the hits """
+        data = self.cache_data
+        found = {}
+        for key in keys:
+            if key in data:
+                item = data.pop(key)
+                data[key] = item
+                found[key] = item
+        return found
+
+    def put_many(self, mapping):
+        """ Add several items to the cache, evicting as put() would """
+        data = self.cache_data
+        for key, item in mapping.items():
+            if key is None or item is None:
+                continue
+            if key in data:
+                del data[key]
+            elif len(data) >= self.max_items:
+                self._evict()
+            data[key] = item
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+""" Capacity and eviction listener shared by the cache policies """
+
+from base_caching import BaseCaching
+
+
+def check_max_items(max_items):
+    """
+    Validate a capacity.
+    Args:
+        max_items: Capacity, BaseCaching.MAX_ITEMS if None.
+    Returns:
+        The capacity.
+    """
+    if max_items is None:
+        max_items = BaseCaching.MAX_ITEMS
+    if max_items < 1:
+        raise ValueError("max_items must be a positive integer")
+    return max_items
+
+
+class EvictionMixin:
+    """
+    EvictionMixin class that gives a cache its default on_evict(),
+    which prints the DISCARD line of every evicted item. Assigning a
+    callable to on_evict replaces it for one instance.
+    """
+
+    def on_evict(self, key, item):
+        """ Print the DISCARD line of an evicted item """
+        print(f"DISCARD: {key}")
+
+
+class CapacityMixin:
+    """
+    CapacityMixin class that gives a cache policy resize(), built on
+    its max_items, cache_data and _evict().
+    """
+
+    def resize(self, max_items, batch=64):
+        """
+        Change the capacity, evicting under the policy as needed.
+        Args:
+            max_items: New capacity, at least 1.
+            batch: Maximum number of items this call evicts, so that
+                shrinking a large cache does not stall.
+        Returns:
+            The number of items still over capacity; call again with
+            the same capacity until it returns 0.
+        """
+        self.max_items = check_max_items(max_items)
+        for _ in range(min(batch, len(self.cache_data) - self.max_items)):
+            self._evict()
+        return max(0, len(self.cache_data) - self.max_items)